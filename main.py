@@ -3,36 +3,31 @@
 Main application entry point for the flashcard application.
 """
 
-import argparse
 import os
 import sys
-from rich.console import Console
 
 from src.core.types import AppState, FlashcardSetStats
-from src.io.operations import (
-    load_flashcard_file,
-    load_statistics_file,
-    save_statistics_file,
-    discover_flashcard_sets,
-)
-from src.ui.interface import (
-    display_menu,
-    display_flashcard_set_menu_with_stats,
-    display_global_statistics,
-    display_exit_message,
-)
-from src.core.session import handle_menu_choice
 from src.__version__ import __version__, __description__
 
 
 def create_app_state(stats_file: str) -> AppState:
     """Create initial application state."""
+    from src.io.operations import load_statistics_file
+
     set_stats = load_statistics_file(stats_file)
     return AppState(flashcard_sets=set_stats)
 
 
 def run_flashcard_app(file_path: str, stats_file: str) -> None:
     """Run the flashcard application for a specific file."""
+    # rich and the UI are only imported once there is something to show,
+    # keeping --help, --version and argument errors fast
+    from rich.console import Console
+
+    from src.io.operations import load_flashcard_file, save_statistics_file
+    from src.ui.interface import display_menu
+    from src.core.session import handle_menu_choice
+
     console = Console()
 
     # Load flashcard set
@@ -40,11 +35,12 @@ def run_flashcard_app(file_path: str, stats_file: str) -> None:
     if flashcard_set is None:
         sys.exit(1)
 
-    # Load application state
-    app_state = create_app_state(stats_file)
+    # Load application state. Stats of every set are kept in a plain
+    # dict that is updated in place rather than copied on each save.
+    all_set_stats = dict(create_app_state(stats_file).flashcard_sets)
 
     # Get or create stats for this set
-    current_set_stats = app_state.flashcard_sets.get(
+    current_set_stats = all_set_stats.get(
         flashcard_set.name, FlashcardSetStats()
     )
 
@@ -53,6 +49,11 @@ def run_flashcard_app(file_path: str, stats_file: str) -> None:
         f"successfully![/green]"
     )
 
+    def save_progress(set_stats: FlashcardSetStats) -> None:
+        """Save a study session's stats so far."""
+        all_set_stats[flashcard_set.name] = set_stats
+        save_statistics_file(stats_file, all_set_stats)
+
     # Main application loop
     session_just_completed = False
     while True:
@@ -63,7 +64,7 @@ def run_flashcard_app(file_path: str, stats_file: str) -> None:
         )
 
         result, session_just_completed = handle_menu_choice(
-            console, choice, flashcard_set, current_set_stats
+            console, choice, flashcard_set, current_set_stats, save_progress
         )
 
         if result == "exit":
@@ -71,28 +72,37 @@ def run_flashcard_app(file_path: str, stats_file: str) -> None:
         elif result is not None and isinstance(
             result, type(current_set_stats)
         ):
+            # Nothing to save if the session didn't change the stats
+            if result == current_set_stats:
+                continue
+
             # Update stats and save
             current_set_stats = result
-            updated_app_state = AppState(
-                flashcard_sets={
-                    **app_state.flashcard_sets,
-                    flashcard_set.name: current_set_stats,
-                }
-            )
-            save_statistics_file(stats_file, updated_app_state.flashcard_sets)
-            app_state = updated_app_state
+            all_set_stats[flashcard_set.name] = current_set_stats
+            save_statistics_file(stats_file, all_set_stats)
 
 
 def run_set_selection_menu(stats_file: str) -> None:
     """Run the set selection menu."""
+    from rich.console import Console
+
+    from src.io.operations import discover_flashcard_sets
+    from src.ui.interface import (
+        display_flashcard_set_menu_with_stats,
+        display_global_statistics,
+        display_exit_message,
+    )
+
     console = Console()
-    app_state = create_app_state(stats_file)
 
     while True:
         flashcard_sets = discover_flashcard_sets()
         choice = display_flashcard_set_menu_with_stats(console, flashcard_sets)
 
         if choice == "stats":
+            # Stats are only read when shown, so they're always current
+            # and the menu opens without parsing them
+            app_state = create_app_state(stats_file)
             display_global_statistics(console, app_state.flashcard_sets)
         elif choice == "quit":
             display_exit_message(console)
@@ -100,12 +110,22 @@ def run_set_selection_menu(stats_file: str) -> None:
         else:
             # choice is a file path, run the flashcard app
             run_flashcard_app(choice, stats_file)
-            # Reload stats after study session
-            app_state = create_app_state(stats_file)
 
 
 def main():
     """Main entry point."""
+    import argparse
+
+    class VersionAction(argparse.Action):
+        """Print the version, importing yaml only when it's asked for."""
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            import yaml
+
+            yaml_parser = "libyaml" if yaml.__with_libyaml__ else "pure Python"
+            print(f"flashcards-tui {__version__} (YAML parser: {yaml_parser})")
+            parser.exit()
+
     parser = argparse.ArgumentParser(
         description=__description__,
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -133,8 +153,9 @@ Examples:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"flashcards-tui {__version__}",
+        action=VersionAction,
+        nargs=0,
+        help="show program's version number and exit",
     )
 
     args = parser.parse_args()
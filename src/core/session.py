@@ -4,15 +4,16 @@ Pure functions for study session logic.
 """
 
 import random
+from collections.abc import Callable, Sequence
+from dataclasses import replace
 from rich.console import Console
 
 from src.core.types import (
     FlashCard,
     FlashcardSet,
     FlashcardSetStats,
-    StudySession,
 )
-from src.core.statistics import update_set_stats, calculate_session_summary
+from src.core.statistics import record_attempt, calculate_session_summary
 from src.ui.interface import (
     display_progress,
     display_question,
@@ -29,35 +30,20 @@ from src.ui.interface import (
     display_flashcard_browser,
 )
 
+# Answers between progress saves during a study session
+_CHECKPOINT_INTERVAL = 10
+
 
 def prepare_cards(
     flashcard_set: FlashcardSet, randomize: bool
-) -> list[FlashCard]:
-    """Prepare cards for study session."""
-    cards = flashcard_set.cards.copy()
-    if randomize:
-        random.shuffle(cards)
-    return cards
-
-
-def create_study_session(
-    flashcard_set: FlashcardSet, randomize: bool = False
-) -> StudySession:
-    """Create a new study session."""
-    cards = prepare_cards(flashcard_set, randomize)
-    return StudySession(
-        cards=cards, current_index=0, correct_count=0, randomized=randomize
-    )
+) -> Sequence[FlashCard]:
+    """Prepare cards for study session.
 
-
-def advance_session(session: StudySession, is_correct: bool) -> StudySession:
-    """Advance the study session to the next card."""
-    return StudySession(
-        cards=session.cards,
-        current_index=session.current_index + 1,
-        correct_count=session.correct_count + (1 if is_correct else 0),
-        randomized=session.randomized,
-    )
+    Sequential sessions use the set's own card tuple without copying.
+    """
+    if randomize:
+        return random.sample(flashcard_set.cards, len(flashcard_set.cards))
+    return flashcard_set.cards
 
 
 def run_study_session(
@@ -65,53 +51,65 @@ def run_study_session(
     flashcard_set: FlashcardSet,
     set_stats: FlashcardSetStats,
     randomize: bool = False,
+    save_progress: Callable[[FlashcardSetStats], None] | None = None,
 ) -> tuple[FlashcardSetStats, int]:
     """Run a complete study session and return updated stats
-    and cards studied."""
+    and cards studied.
+
+    If given, save_progress is called with the stats so far every
+    _CHECKPOINT_INTERVAL answers, so a killed session loses at most that
+    many. The caller still saves the returned stats at the end.
+    """
     if not flashcard_set.cards:
         console.print("[red]No flashcards available![/red]")
         return set_stats, 0
 
-    session = create_study_session(flashcard_set, randomize)
-    current_stats = set_stats
+    cards = prepare_cards(flashcard_set, randomize)
+    total = len(cards)
+    # Copy card_stats once so attempts can be recorded in place
+    current_stats = replace(set_stats, card_stats=dict(set_stats.card_stats))
     cards_studied = 0
 
-    while not session.is_complete:
-        console.clear()
-
-        current, total = session.progress
-        display_progress(console, current, total)
-
-        card = session.current_card
-        if card is None:
-            break
-
-        display_question(console, card)
-        wait_for_user_thinking(console)
-        display_answer(console, card)
-        display_code_example(console, card)
-
-        response = get_user_response(console)
-
-        # Handle quit and skip
-        if response == "q":
-            break
-        elif response == "s":
+    try:
+        # Walk the prepared cards in order
+        for current, card in enumerate(cards, start=1):
+            # Buffer the card's screen and write it to the terminal at once
+            with console:
+                console.clear()
+                display_progress(console, current, total)
+                display_question(console, card)
+
+            wait_for_user_thinking(console)
+            display_answer(console, card)
+            display_code_example(console, card)
+
+            response = get_user_response(console)
+
+            # Handle quit and skip
+            if response == "q":
+                break
+            elif response == "s":
+                cards_studied = current
+                break
+
+            # Process response
+            is_correct = response == "y"
+            display_user_feedback(console, response)
+
+            # Update statistics
+            current_stats = record_attempt(current_stats, card, is_correct)
             cards_studied = current
-            break
-
-        # Process response
-        is_correct = response == "y"
-        display_user_feedback(console, response)
-
-        # Update statistics
-        current_stats = update_set_stats(current_stats, card, is_correct)
 
-        # Advance session
-        session = advance_session(session, is_correct)
-        cards_studied = current
+            if (
+                save_progress is not None
+                and current % _CHECKPOINT_INTERVAL == 0
+            ):
+                save_progress(current_stats)
 
-        continue_to_next_card(console, current, total, response)
+            continue_to_next_card(console, current, total, response)
+    except KeyboardInterrupt:
+        # End the session early; attempts so far are still returned
+        pass
 
     # Show session summary
     session_summary = calculate_session_summary(cards_studied, current_stats)
@@ -125,6 +123,7 @@ def handle_menu_choice(
     choice: str,
     flashcard_set: FlashcardSet,
     set_stats: FlashcardSetStats,
+    save_progress: Callable[[FlashcardSetStats], None] | None = None,
 ) -> tuple[FlashcardSetStats | str | None, bool]:
     """Handle menu choice and return updated stats if applicable.
 
@@ -133,12 +132,20 @@ def handle_menu_choice(
     """
     if choice == "1":
         new_stats, _ = run_study_session(
-            console, flashcard_set, set_stats, randomize=False
+            console,
+            flashcard_set,
+            set_stats,
+            randomize=False,
+            save_progress=save_progress,
         )
         return new_stats, True
     elif choice == "2":
         new_stats, _ = run_study_session(
-            console, flashcard_set, set_stats, randomize=True
+            console,
+            flashcard_set,
+            set_stats,
+            randomize=True,
+            save_progress=save_progress,
         )
         return new_stats, True
     elif choice == "b":
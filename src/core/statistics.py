@@ -3,8 +3,15 @@
 Pure functions for statistics calculations.
 """
 
+import heapq
+from dataclasses import replace
+from operator import itemgetter
+
 from src.core.types import FlashCard, FlashcardSetStats, CardStats
 
+# Shared default for cards without attempts; CardStats is immutable
+_NO_ATTEMPTS = CardStats()
+
 
 def update_card_stats(card_stats: CardStats, is_correct: bool) -> CardStats:
     """Update card statistics with new attempt."""
@@ -18,21 +25,33 @@ def update_set_stats(
     set_stats: FlashcardSetStats, card: FlashCard, is_correct: bool
 ) -> FlashcardSetStats:
     """Update set statistics with new attempt."""
-    # Use first 50 chars of question as card key
-    card_key = card.question[:50]
+    # Copy card_stats so the original stats are left untouched
+    return record_attempt(
+        replace(set_stats, card_stats=dict(set_stats.card_stats)),
+        card,
+        is_correct,
+    )
 
-    # Update or create card stats
-    current_card_stats = set_stats.card_stats.get(card_key, CardStats())
-    new_card_stats = update_card_stats(current_card_stats, is_correct)
 
-    # Create new card_stats dict with updated values
-    new_card_stats_dict = dict(set_stats.card_stats)
-    new_card_stats_dict[card_key] = new_card_stats
+def record_attempt(
+    set_stats: FlashcardSetStats, card: FlashCard, is_correct: bool
+) -> FlashcardSetStats:
+    """Record an attempt by updating set_stats.card_stats in place.
+
+    The returned stats share their card_stats dict with set_stats, so
+    this avoids copying every card's stats on each attempt. Use
+    update_set_stats when set_stats must not be modified.
+    """
+    card_key = card.key
+    card_stats = set_stats.card_stats
+    card_stats[card_key] = update_card_stats(
+        card_stats.get(card_key, _NO_ATTEMPTS), is_correct
+    )
 
     return FlashcardSetStats(
         correct_answers=set_stats.correct_answers + (1 if is_correct else 0),
         total_attempts=set_stats.total_attempts + 1,
-        card_stats=new_card_stats_dict,
+        card_stats=card_stats,
     )
 
 
@@ -40,16 +59,27 @@ def get_most_challenging_cards(
     set_stats: FlashcardSetStats, limit: int = 3
 ) -> list[tuple[str, float, int]]:
     """Get the most challenging cards based on accuracy."""
-    card_difficulties = []
+    # Same formula as CardStats.accuracy, inlined to skip a property call
+    # and its zero check per card
+    card_difficulties = (
+        (card_key, stats.correct / total * 100, total)
+        for card_key, stats in set_stats.card_stats.items()
+        if (total := stats.total) > 0
+    )
 
-    for card_key, stats in set_stats.card_stats.items():
-        if stats.total > 0:
-            accuracy = stats.accuracy
-            card_difficulties.append((card_key, accuracy, stats.total))
+    # Return the N lowest-accuracy cards without sorting the whole list
+    return heapq.nsmallest(limit, card_difficulties, key=itemgetter(1))
 
-    # Sort by accuracy (ascending) and return top N most challenging
-    card_difficulties.sort(key=lambda x: x[1])
-    return card_difficulties[:limit]
+
+def get_valid_sets(
+    set_stats: dict[str, FlashcardSetStats],
+) -> list[tuple[str, FlashcardSetStats]]:
+    """Get sets holding real study data, skipping legacy and temp sets."""
+    return [
+        (set_name, stats)
+        for set_name, stats in set_stats.items()
+        if set_name != "legacy_data" and not set_name.startswith("tmp")
+    ]
 
 
 def calculate_overall_accuracy(
@@ -59,10 +89,9 @@ def calculate_overall_accuracy(
     total_attempts = 0
     total_correct = 0
 
-    for set_name, stats in set_stats.items():
-        if set_name != "legacy_data" and not set_name.startswith("tmp"):
-            total_attempts += stats.total_attempts
-            total_correct += stats.correct_answers
+    for _, stats in get_valid_sets(set_stats):
+        total_attempts += stats.total_attempts
+        total_correct += stats.correct_answers
 
     accuracy = (
         (total_correct / total_attempts * 100) if total_attempts > 0 else 0.0
@@ -76,12 +105,8 @@ def get_sets_with_attempts(
     """Get sets that have at least one attempt."""
     return [
         (set_name, stats)
-        for set_name, stats in set_stats.items()
-        if (
-            set_name != "legacy_data"
-            and not set_name.startswith("tmp")
-            and stats.total_attempts > 0
-        )
+        for set_name, stats in get_valid_sets(set_stats)
+        if stats.total_attempts > 0
     ]
 
 
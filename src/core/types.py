@@ -3,19 +3,26 @@
 Immutable data types for the flashcard application.
 """
 
+import sys
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlashCard:
     """Immutable flashcard data structure."""
 
     question: str
     answer: str
     code_example: str | None = None
+    # Defaulted so msgspec can construct cards; always set in __post_init__
+    key: str = field(default="", init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Statistics are keyed by the first 50 chars of the question
+        object.__setattr__(self, "key", sys.intern(self.question[:50]))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CardStats:
     """Immutable card statistics."""
 
@@ -28,7 +35,7 @@ class CardStats:
         return (self.correct / self.total * 100) if self.total > 0 else 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlashcardSetStats:
     """Immutable flashcard set statistics."""
 
@@ -50,39 +57,12 @@ class FlashcardSetStats:
 class FlashcardSet:
     """Immutable flashcard set containing cards and metadata."""
 
-    cards: list[FlashCard]
+    cards: tuple[FlashCard, ...]
     name: str
     title: str
     file_path: str
 
 
-@dataclass(frozen=True)
-class StudySession:
-    """Immutable study session state."""
-
-    cards: list[FlashCard]
-    current_index: int = 0
-    correct_count: int = 0
-    randomized: bool = False
-
-    @property
-    def is_complete(self) -> bool:
-        """Check if session is complete."""
-        return self.current_index >= len(self.cards)
-
-    @property
-    def current_card(self) -> FlashCard | None:
-        """Get current card if available."""
-        if self.is_complete:
-            return None
-        return self.cards[self.current_index]
-
-    @property
-    def progress(self) -> tuple[int, int]:
-        """Get current progress as (current, total)."""
-        return (self.current_index + 1, len(self.cards))
-
-
 @dataclass(frozen=True)
 class AppState:
     """Immutable application state."""
@@ -3,10 +3,30 @@
 Pure functions for file I/O operations.
 """
 
+import hashlib
 import json
 import os
+import stat
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 import yaml
-from rich.console import Console
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; stats stay JSON-only without it
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 from src.core.types import (
     FlashCard,
@@ -15,231 +35,539 @@ from src.core.types import (
     CardStats,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Get the console for error messages.
+
+    rich is imported on first use, so loading data doesn't pay for it.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _format_set_name(set_name: str) -> str:
+    """Format a file name as a title, e.g. python_basics -> Python Basics."""
+    return set_name.replace("_", " ").title()
+
+
+@dataclass(frozen=True)
+class _SetMetadata:
+    """Title, icon and card count read from a flashcard file."""
+
+    title: str | None
+    icon: str
+    card_count: int
+
+    def display_name(self, set_name: str) -> str:
+        """Get the display name, falling back to the formatted set name."""
+        if self.title is None:
+            return _format_set_name(set_name)
+        return f"{self.icon} {self.title}".strip() if self.icon else self.title
+
+
+_FLASHCARD_EXTENSIONS = (".yaml", ".yml")
+
+# Upper bound on threads used to parse changed flashcard files
+_MAX_PARSE_WORKERS = 8
+
+# A file's (mtime_ns, size), which the parse caches are keyed by. The
+# size catches edits that keep the mtime, e.g. on filesystems with
+# coarse timestamps or after copies that preserve them.
+_FileSignature = tuple[int, int]
+
+# Parsed flashcard files keyed by path: (signature, data). The set menu
+# parses every file for its metadata, so the set the user then picks is
+# loaded from here instead of being parsed a second time.
+_flashcard_file_cache: dict[str, tuple[_FileSignature, Any]] = {}
+
+
+def _file_signature(file_stat: os.stat_result) -> _FileSignature:
+    """Get the signature the parse caches key a file's contents by."""
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _parse_flashcard_file(
+    file_path: str, signature: _FileSignature | None = None
+) -> Any:
+    """Parse a flashcard YAML file.
+
+    Results are cached by modification time and size, so each file is
+    only parsed again after it changes. Callers that already have the
+    file's signature (e.g. from os.scandir) can pass it to skip the stat
+    call.
+    """
+    if signature is None:
+        signature = _file_signature(os.stat(file_path))
+
+    cached = _flashcard_file_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # The JSON cache on disk skips the YAML parse across runs
+    hit, data = _read_flashcard_cache(file_path, signature)
+    if not hit:
+        # Bytes let the parser detect the encoding (UTF-8 by default)
+        # in one pass, independent of the locale's text encoding
+        with open(file_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_YamlLoader)
+        _write_flashcard_cache(file_path, signature, data)
+
+    _flashcard_file_cache[file_path] = (signature, data)
+    return data
+
+
+def _get_cache_dir() -> str:
+    """Get the per-user directory parsed flashcard files are cached in."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "flashcards-tui")
+
+
+def get_flashcard_cache_path(file_path: str) -> str:
+    """Get the path of a flashcard file's JSON cache.
+
+    Caches are kept in the per-user cache directory, named by a hash of
+    the file's absolute path, so nothing is written next to the file.
+    """
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(file_path)))
+    return os.path.join(_get_cache_dir(), f"{digest.hexdigest()}.json")
+
+
+def _read_flashcard_cache(
+    file_path: str, signature: _FileSignature
+) -> tuple[bool, Any]:
+    """Read a flashcard file's cached parse.
+
+    Returns (hit, data); an empty file's parse is a cached None.
+    """
+    try:
+        with open(get_flashcard_cache_path(file_path), "rb") as f:
+            cache = _loads_json(f.read())
+    except (OSError, ValueError):
+        return False, None
+
+    if not isinstance(cache, dict) or "data" not in cache:
+        return False, None
+    if (cache.get("mtime_ns"), cache.get("size")) != signature:
+        return False, None
+    return True, cache["data"]
+
+
+def _write_flashcard_cache(
+    file_path: str, signature: _FileSignature, data: Any
+) -> None:
+    """Cache a flashcard file's parse as JSON, keyed by its signature."""
+    try:
+        mtime_ns, size = signature
+        payload = _dumps_json(
+            {"mtime_ns": mtime_ns, "size": size, "data": data}
+        )
+        # Skip data JSON can't represent exactly, e.g. YAML dates
+        if _loads_json(payload)["data"] != data:
+            return
+        cache_path = get_flashcard_cache_path(file_path)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        _write_file_atomic(cache_path, payload)
+    except (OSError, TypeError, ValueError):
+        # The cache is only an optimization, the parse is still valid
+        pass
+
+
+def _load_set_metadata(
+    file_path: str, signature: _FileSignature | None = None
+) -> _SetMetadata | None:
+    """Load a flashcard file's metadata, or None if it can't be read."""
+    try:
+        data = _parse_flashcard_file(file_path, signature)
+
+        if data and "title" in data:
+            title = data["title"]
+            icon = data.get("icon", "")
+        else:
+            title = None
+            icon = ""
+
+        card_count = (
+            len(data["flashcards"]) if data and "flashcards" in data else 0
+        )
+    except Exception:
+        return None
+
+    return _SetMetadata(title=title, icon=icon, card_count=card_count)
+
+
+def _dumps_json(data: object) -> bytes:
+    """Serialize data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_umask() -> int:
+    """Read the process umask, which os.umask only returns when set."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode of files created with open(), which mkstemp's 0600 is changed to.
+# Read once at import, since reading it briefly changes it for every
+# thread.
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def _write_file_atomic(
+    file_path: str, payload: bytes, durable: bool = False
+) -> None:
+    """Write payload to a temp file and rename it over file_path.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one. With durable, the data is flushed to disk before the
+    rename, so a power loss can't leave an empty file in its place;
+    caches that can be rebuilt skip that cost. The file keeps its mode,
+    or gets the mode open() would give a new one.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path) or ".",
+        prefix=os.path.basename(file_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _is_msgpack_file(stats_file: str) -> bool:
+    """Check if a statistics file uses the MessagePack format."""
+    return stats_file.endswith(".msgpack")
+
+
+def _load_msgpack_statistics(
+    stats_file: str,
+) -> dict[str, FlashcardSetStats]:
+    """Load statistics from a MessagePack file."""
+    if not os.path.exists(stats_file):
+        # Migrate from a JSON statistics file with the same name
+        return load_statistics_file(os.path.splitext(stats_file)[0] + ".json")
+
+    if msgspec is None:
+        return {}
+
+    try:
+        with open(stats_file, "rb") as f:
+            stats = msgspec.msgpack.decode(
+                f.read(), type=dict[str, dict[str, FlashcardSetStats]]
+            )
+    except (OSError, msgspec.MsgspecError):
+        # Unreadable or corrupted stats file, reset to defaults
+        return {}
+
+    return stats.get("flashcard_sets", {})
+
+
+def _decode_json_statistics(
+    payload: bytes,
+) -> dict[str, FlashcardSetStats] | None:
+    """Decode current-format JSON statistics straight into stats objects.
+
+    Returns None if msgspec is unavailable or the payload doesn't match
+    the current format (e.g. legacy or corrupted files), leaving those to
+    the generic loader.
+    """
+    if msgspec is None:
+        return None
+
+    try:
+        stats = msgspec.json.decode(
+            payload, type=dict[str, dict[str, FlashcardSetStats]]
+        )
+    except msgspec.MsgspecError:
+        return None
+
+    return stats.get("flashcard_sets", {})
+
+
+def _build_cards(
+    raw_cards: list[dict[str, Any]],
+) -> tuple[FlashCard, ...]:
+    """Build flashcards from parsed YAML card mappings."""
+    if msgspec is not None:
+        try:
+            # msgspec validates and constructs the cards in C
+            return msgspec.convert(raw_cards, type=tuple[FlashCard, ...])
+        except msgspec.ValidationError:
+            # Fall back for cards msgspec's strict typing rejects
+            pass
+
+    return tuple(
+        FlashCard(
+            question=card["question"],
+            answer=card["answer"],
+            code_example=card.get("code_example"),
+        )
+        for card in raw_cards
+    )
+
 
 def load_flashcard_file(file_path: str) -> FlashcardSet | None:
     """Load flashcards from a YAML file."""
     try:
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
+        data = _parse_flashcard_file(file_path)
 
         # Extract set name from file path
-        set_name = (
-            os.path.basename(file_path)
-            .replace(".yaml", "")
-            .replace(".yml", "")
-        )
+        set_name = os.path.splitext(os.path.basename(file_path))[0]
 
         # Get custom title or use filename as fallback
-        title = data.get("title", set_name.replace("_", " ").title())
+        title = (
+            data["title"] if "title" in data else _format_set_name(set_name)
+        )
 
-        cards = [
-            FlashCard(
-                question=card["question"],
-                answer=card["answer"],
-                code_example=card.get("code_example"),
-            )
-            for card in data["flashcards"]
-        ]
+        cards = _build_cards(data["flashcards"])
 
         return FlashcardSet(
             cards=cards, name=set_name, title=title, file_path=file_path
         )
 
     except FileNotFoundError:
-        console = Console()
-        console.print(f"[red]Error: Could not find {file_path}[/red]")
+        _get_console().print(f"[red]Error: Could not find {file_path}[/red]")
         return None
     except yaml.YAMLError as e:
-        console = Console()
-        console.print(
+        _get_console().print(
             f"[red]Error: Invalid YAML format in {file_path}: {e}[/red]"
         )
         return None
 
 
+def _decode_set_stats(set_data: dict[str, Any]) -> FlashcardSetStats:
+    """Build one set's statistics from its decoded JSON mapping."""
+    return FlashcardSetStats(
+        correct_answers=set_data.get("correct_answers", 0),
+        total_attempts=set_data.get("total_attempts", 0),
+        card_stats={
+            card_key: CardStats(
+                correct=card_data.get("correct", 0),
+                total=card_data.get("total", 0),
+            )
+            for card_key, card_data in set_data.get("card_stats", {}).items()
+        },
+    )
+
+
 def load_statistics_file(stats_file: str) -> dict[str, FlashcardSetStats]:
-    """Load statistics from JSON file."""
+    """Load statistics from a JSON or MessagePack file."""
+    if _is_msgpack_file(stats_file):
+        return _load_msgpack_statistics(stats_file)
+
+    if not os.path.exists(stats_file):
+        # First time running, stats file doesn't exist yet
+        return {}
+
     try:
-        with open(stats_file, "r") as f:
-            stats = json.load(f)
+        with open(stats_file, "rb") as f:
+            payload = f.read()
+
+        # msgspec builds the stats objects in one pass, without the
+        # intermediate dicts of the generic path below
+        decoded = _decode_json_statistics(payload)
+        if decoded is not None:
+            return decoded
+
+        stats = _loads_json(payload)
 
         # Check if this is the old format (needs migration)
         if "correct_answers" in stats and "flashcard_sets" not in stats:
             # Migrate old format to new per-set format
-            legacy_card_stats = {}
-            for card_key, card_data in stats.get("card_stats", {}).items():
-                legacy_card_stats[card_key] = CardStats(
-                    correct=card_data.get("correct", 0),
-                    total=card_data.get("total", 0),
-                )
-
-            return {
-                "legacy_data": FlashcardSetStats(
-                    correct_answers=stats.get("correct_answers", 0),
-                    total_attempts=stats.get("total_attempts", 0),
-                    card_stats=legacy_card_stats,
-                )
-            }
-        else:
-            # Load new format
-            flashcard_sets_data = stats.get("flashcard_sets", {})
-            result = {}
-
-            for set_name, set_data in flashcard_sets_data.items():
-                card_stats = {}
-                for card_key, card_data in set_data.get(
-                    "card_stats", {}
-                ).items():
-                    card_stats[card_key] = CardStats(
-                        correct=card_data.get("correct", 0),
-                        total=card_data.get("total", 0),
-                    )
-
-                result[set_name] = FlashcardSetStats(
-                    correct_answers=set_data.get("correct_answers", 0),
-                    total_attempts=set_data.get("total_attempts", 0),
-                    card_stats=card_stats,
-                )
+            return {"legacy_data": _decode_set_stats(stats)}
 
-            return result
+        # Load new format
+        return {
+            set_name: _decode_set_stats(set_data)
+            for set_name, set_data in stats.get("flashcard_sets", {}).items()
+        }
 
     except FileNotFoundError:
-        # First time running, stats file doesn't exist yet
+        # Removed since the existence check above
         return {}
-    except json.JSONDecodeError:
-        # Corrupted stats file, reset to defaults
+    except ValueError:
+        # Corrupted stats file, reset to defaults. Every JSON backend's
+        # decode error, and UnicodeDecodeError, is a ValueError.
         return {}
 
 
-def save_statistics_file(
-    stats_file: str, set_stats: dict[str, FlashcardSetStats]
-) -> bool:
-    """Save statistics to JSON file."""
-    # Convert dataclasses to dictionaries for JSON serialization
-    flashcard_sets_dict = {}
-    for set_name, stats in set_stats.items():
-        card_stats_dict = {}
-        for card_key, card_stats in stats.card_stats.items():
-            card_stats_dict[card_key] = {
-                "correct": card_stats.correct,
-                "total": card_stats.total,
+def _statistics_to_dict(
+    set_stats: dict[str, FlashcardSetStats],
+) -> dict[str, Any]:
+    """Convert statistics to plain dictionaries for JSON serialization."""
+    # orjson can serialize the dataclasses directly, but for slotted
+    # dataclasses that measured about 2x slower than this conversion
+    return {
+        "flashcard_sets": {
+            set_name: {
+                "correct_answers": stats.correct_answers,
+                "total_attempts": stats.total_attempts,
+                "card_stats": {
+                    card_key: {
+                        "correct": card_stats.correct,
+                        "total": card_stats.total,
+                    }
+                    for card_key, card_stats in stats.card_stats.items()
+                },
             }
-
-        flashcard_sets_dict[set_name] = {
-            "correct_answers": stats.correct_answers,
-            "total_attempts": stats.total_attempts,
-            "card_stats": card_stats_dict,
+            for set_name, stats in set_stats.items()
         }
+    }
+
 
-    stats_data = {"flashcard_sets": flashcard_sets_dict}
+def save_statistics_file(
+    stats_file: str, set_stats: dict[str, FlashcardSetStats]
+) -> bool:
+    """Save statistics to a JSON or MessagePack file."""
     try:
-        with open(stats_file, "w") as f:
-            json.dump(stats_data, f, indent=2)
+        if _is_msgpack_file(stats_file):
+            if msgspec is None:
+                raise RuntimeError(
+                    "msgspec is required for .msgpack statistics files"
+                )
+            # msgspec encodes the dataclasses directly
+            payload = msgspec.msgpack.encode({"flashcard_sets": set_stats})
+        else:
+            payload = _dumps_json(_statistics_to_dict(set_stats))
+
+        _write_file_atomic(stats_file, payload, durable=True)
         return True
     except Exception as e:
-        console = Console()
-        console.print(
+        _get_console().print(
             f"[yellow]Warning: Could not save statistics: {e}[/yellow]"
         )
         return False
 
 
+def _parse_changed_files(files: list[tuple[str, _FileSignature]]) -> None:
+    """Parse (path, signature) files missing from the cache concurrently.
+
+    Overlaps the reads on slow or network filesystems; files that are
+    already cached are skipped, so warm calls start no threads.
+    """
+    stale = [
+        (file_path, signature)
+        for file_path, signature in files
+        if _flashcard_file_cache.get(file_path, (None,))[0] != signature
+    ]
+    if len(stale) < 2:
+        return
+
+    # Imported here since warm runs never need a thread pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_PARSE_WORKERS, len(stale))
+    ) as executor:
+        # Results land in the parse cache; failures aren't cached and are
+        # handled again by the caller's own lookup
+        list(
+            executor.map(
+                _load_set_metadata,
+                [file_path for file_path, _ in stale],
+                [signature for _, signature in stale],
+            )
+        )
+
+
 def discover_flashcard_sets(
     directory: str = "flashcard_sets",
-) -> list[tuple[str, str]]:
-    """Discover all flashcard files in the specified directory."""
-    flashcard_sets: list[tuple[str, str, str]] = []
+) -> list[tuple[str, str, int | None]]:
+    """Discover all flashcard files in the specified directory.
+
+    Returns (display name, file path, card count) tuples sorted by title.
+    The card count comes from the same parse as the title, and is None if
+    the file couldn't be read.
+    """
+    flashcard_sets: list[tuple[str, str, int | None, str]] = []
 
     if not os.path.exists(directory):
         return []
 
-    for filename in os.listdir(directory):
-        valid_extensions = (".yaml", ".yml")
-        if filename.endswith(valid_extensions) and not filename.startswith(
-            "."
-        ):
-            file_path = os.path.join(directory, filename)
-
-            # Try to read the custom title from the file
-            try:
-                with open(file_path, "r") as f:
-                    data = yaml.safe_load(f)
-
-                # Use custom title and icon if available, otherwise fallback to filename
-                if data and "title" in data:
-                    title = data["title"]
-                    icon = data.get("icon", "")
-                    display_name = f"{icon} {title}".strip() if icon else title
-                    sort_key = title  # Sort by title only, ignoring icon
-                else:
-                    display_name = filename.replace(".yaml", "").replace(
-                        ".yml", ""
-                    )
-                    display_name = display_name.replace("_", " ").title()
-                    sort_key = display_name
-            except Exception:
-                # If file can't be read, use filename as fallback
-                display_name = filename.replace(".yaml", "").replace(
-                    ".yml", ""
+    # (path, set name, signature) of every flashcard file
+    candidates: list[tuple[str, str, _FileSignature]] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            filename = entry.name
+            if (
+                filename.startswith(".")
+                or not filename.endswith(_FLASHCARD_EXTENSIONS)
+                or not entry.is_file()
+            ):
+                continue
+
+            candidates.append(
+                (
+                    entry.path,
+                    os.path.splitext(filename)[0],
+                    _file_signature(entry.stat()),
                 )
-                display_name = display_name.replace("_", " ").title()
-                sort_key = display_name
+            )
 
-            flashcard_sets.append((display_name, file_path, sort_key))
+    _parse_changed_files(
+        [(file_path, signature) for file_path, _, signature in candidates]
+    )
+
+    for file_path, set_name, signature in candidates:
+        # Use custom title and icon if available, otherwise fallback to filename
+        metadata = _load_set_metadata(file_path, signature)
+        if metadata is not None and metadata.title is not None:
+            display_name = metadata.display_name(set_name)
+            sort_key = metadata.title  # Sort by title only, ignoring icon
+        else:
+            display_name = _format_set_name(set_name)
+            sort_key = display_name
+
+        card_count = metadata.card_count if metadata is not None else None
+        flashcard_sets.append((display_name, file_path, card_count, sort_key))
 
     # Sort by title alphabetically (ignoring icons)
-    flashcard_sets.sort(key=lambda x: x[2].lower())
+    flashcard_sets.sort(key=lambda x: x[3].lower())
 
-    # Return only display_name and file_path (remove sort_key)
+    # Drop the sort key
     return [
-        (display_name, file_path)
-        for display_name, file_path, _ in flashcard_sets
+        (display_name, file_path, card_count)
+        for display_name, file_path, card_count, _ in flashcard_sets
     ]
 
 
 def get_set_display_name(set_name: str) -> str:
     """Get the display name for a flashcard set."""
-    directory = "flashcard_sets"
-    if os.path.exists(directory):
-        for filename in os.listdir(directory):
-            if filename.endswith((".yaml", ".yml")):
-                file_set_name = filename.replace(".yaml", "").replace(
-                    ".yml", ""
-                )
-                if file_set_name == set_name:
-                    try:
-                        file_path = os.path.join(directory, filename)
-                        with open(file_path, "r") as f:
-                            data = yaml.safe_load(f)
-
-                        if data and "title" in data:
-                            title = data["title"]
-                            icon = data.get("icon", "")
-                            return f"{icon} {title}".strip() if icon else title
-                    except Exception:
-                        pass
+    for extension in _FLASHCARD_EXTENSIONS:
+        metadata = _load_set_metadata(
+            os.path.join("flashcard_sets", set_name + extension)
+        )
+        if metadata is not None and metadata.title is not None:
+            return metadata.display_name(set_name)
 
     # Fallback to formatted filename
-    return set_name.replace("_", " ").title()
-
-
-def get_set_card_count(set_name: str) -> int:
-    """Get the number of cards in a flashcard set."""
-    directory = "flashcard_sets"
-    if os.path.exists(directory):
-        for filename in os.listdir(directory):
-            if filename.endswith((".yaml", ".yml")):
-                file_set_name = filename.replace(".yaml", "").replace(
-                    ".yml", ""
-                )
-                if file_set_name == set_name:
-                    try:
-                        file_path = os.path.join(directory, filename)
-                        with open(file_path, "r") as f:
-                            data = yaml.safe_load(f)
-
-                        if data and "flashcards" in data:
-                            return len(data["flashcards"])
-                    except Exception:
-                        pass
-    return 0
+    return _format_set_name(set_name)
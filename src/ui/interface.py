@@ -5,60 +5,86 @@ Pure functions for UI rendering.
 
 import os
 import sys
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.text import Text
-from rich.table import Table
-from rich.syntax import Syntax
 from rich.live import Live
 from rich import box
 
 from src.core.types import FlashCard, FlashcardSet, FlashcardSetStats
-from src.io.operations import get_set_display_name, get_set_card_count
-from src.core.statistics import get_most_challenging_cards
+from src.io.operations import (
+    discover_flashcard_sets,
+    get_set_display_name,
+)
+from src.core.statistics import get_most_challenging_cards, get_valid_sets
+
+if TYPE_CHECKING:
+    from rich.syntax import Lexer, Syntax, SyntaxTheme
+
+# Fixed menus, built once: (label, value) pairs
+_MAIN_MENU_OPTIONS = (
+    ("📚 Study all flashcards", "1"),
+    ("🎲 Study random flashcards", "2"),
+    ("👁️ Browse all flashcards", "b"),
+    ("📊 View statistics", "s"),
+    ("🔄 Reset statistics", "r"),
+    ("🚪 Exit", "q"),
+)
+_RESPONSE_MENU_OPTIONS = (
+    ("✅ Yes, I got it right", "y"),
+    ("❌ No, I got it wrong", "n"),
+    ("📊 Show session summary", "s"),
+    ("🚪 Quit to menu", "q"),
+)
+_RESET_MENU_OPTIONS = (
+    ("❌ No, keep my stats", "n"),
+    ("✅ Yes, reset stats", "y"),
+)
+
+# Per-answer feedback, styled once instead of parsing markup every card
+_FEEDBACK_CORRECT = Text("Great job! 🎉", style="green")
+_FEEDBACK_WRONG = Text("Keep practicing! 💪", style="yellow")
 
 
 def display_menu(
     console: Console, set_title: str, clear_screen: bool = True
 ) -> str:
     """Display the main menu and return user choice."""
-    options = [
-        ("📚 Study all flashcards", "1"),
-        ("🎲 Study random flashcards", "2"),
-        ("👁️ Browse all flashcards", "b"),
-        ("📊 View statistics", "s"),
-        ("🔄 Reset statistics", "r"),
-        ("🚪 Exit", "q"),
-    ]
-
     return _show_arrow_key_menu(
         console,
         f"🎓 {set_title}",
-        options,
+        _MAIN_MENU_OPTIONS,
         default_index=0,
         clear_screen=clear_screen,
     )
 
 
 def display_progress(console: Console, current: int, total: int) -> None:
-    """Display current progress."""
-    progress = f"Card {current}/{total}"
-    console.print(f"[dim]{progress}[/dim]")
-    console.print()
+    """Display current progress, followed by a blank line."""
+    console.print(f"Card {current}/{total}", style="dim", end="\n\n")
 
 
-def display_question(console: Console, card: FlashCard) -> None:
-    """Display a flashcard question."""
-    question_panel = Panel(
-        card.question,
-        title="❓ Question",
-        border_style="blue",
+@lru_cache(maxsize=512)
+def _create_card_panel(content: str, title: str, border_style: str) -> Panel:
+    """Create a question/answer panel, reused across redraws."""
+    return Panel(
+        content,
+        title=title,
+        border_style=border_style,
         padding=(1, 2),
         width=80,
     )
-    console.print(question_panel)
+
+
+def display_question(console: Console, card: FlashCard) -> None:
+    """Display a flashcard question."""
+    console.print(_create_card_panel(card.question, "❓ Question", "blue"))
 
 
 def wait_for_user_thinking(console: Console) -> None:
@@ -72,14 +98,7 @@ def wait_for_user_thinking(console: Console) -> None:
 
 def display_answer(console: Console, card: FlashCard) -> None:
     """Display the flashcard answer."""
-    answer_panel = Panel(
-        card.answer,
-        title="✅ Answer",
-        border_style="green",
-        padding=(1, 2),
-        width=80,
-    )
-    console.print(answer_panel)
+    console.print(_create_card_panel(card.answer, "✅ Answer", "green"))
 
 
 def display_code_example(console: Console, card: FlashCard) -> None:
@@ -109,62 +128,104 @@ def _calculate_max_code_lines(console: Console) -> int:
     return max(6, min(available_lines, 30))
 
 
+@lru_cache(maxsize=None)
+def _get_code_style() -> tuple["Lexer | str", "SyntaxTheme"]:
+    """Resolve the Python lexer and code theme once.
+
+    Syntax otherwise looks both up by name every time code is rendered.
+    """
+    # Imported here so Pygments is only loaded once code is shown
+    from rich.syntax import Syntax
+
+    lexer = Syntax("", "python").lexer
+    return lexer or "python", Syntax.get_theme("catppuccin-mocha")
+
+
+@lru_cache(maxsize=None)
+def _get_syntax_class() -> "type[Syntax]":
+    """Get a Syntax subclass that runs Pygments on its code only once.
+
+    Syntax otherwise tokenizes the code again on every render, e.g. each
+    time a cached code panel is redrawn.
+    """
+    from rich.syntax import Syntax
+
+    class _HighlightOnceSyntax(Syntax):
+        _highlighted: tuple[str, Any, Text] | None = None
+
+        def highlight(
+            self,
+            code: str,
+            line_range: tuple[int | None, int | None] | None = None,
+        ) -> Text:
+            cached = self._highlighted
+            if cached is None or cached[:2] != (code, line_range):
+                text = super().highlight(code, line_range)
+                cached = self._highlighted = (code, line_range, text)
+            # Rendering modifies the Text it gets, so hand out a copy
+            return cached[2].copy()
+
+    return _HighlightOnceSyntax
+
+
+@lru_cache(maxsize=256)
+def _create_code_panel(code: str, title: str) -> Panel:
+    """Create a syntax-highlighted code panel, reused across redraws."""
+    lexer, theme = _get_code_style()
+    syntax = _get_syntax_class()(
+        code,
+        lexer,
+        theme=theme,
+        line_numbers=True,
+        background_color="#1e1e2e",
+    )
+    return Panel(
+        syntax,
+        title=title,
+        border_style="cyan",
+        padding=(1, 2),
+        width=80,
+    )
+
+
 def _display_code_with_expansion(console: Console, card: FlashCard) -> None:
     """Display code with truncation and expansion option."""
     code = card.code_example
     if code is None:
         return
-    lines = code.split("\n")
+    # Count lines without splitting the code into a list of them
+    line_count = code.count("\n") + 1
     max_lines = _calculate_max_code_lines(console)
 
-    if len(lines) <= max_lines:
+    if line_count <= max_lines:
         # Short code - display normally
-        syntax = Syntax(
-            code,
-            "python",
-            theme="catppuccin-mocha",
-            line_numbers=True,
-            background_color="#1e1e2e",
-        )
-        code_panel = Panel(
-            syntax,
-            title="💻 Code Example",
-            border_style="cyan",
-            padding=(1, 2),
-            width=80,
-        )
+        code_panel = _create_code_panel(code, "💻 Code Example")
         console.print(code_panel)
     else:
         # Long code - show truncated version first
-        _show_truncated_code(console, card, lines, max_lines)
+        _show_truncated_code(console, card, line_count, max_lines)
 
 
 def _show_truncated_code(
-    console: Console, card: FlashCard, lines: list[str], max_lines: int
+    console: Console, card: FlashCard, line_count: int, max_lines: int
 ) -> None:
     """Show truncated code with expansion options."""
-    truncated_lines = lines[:max_lines]
-    truncated_code = "\n".join(truncated_lines)
-    remaining_lines = len(lines) - max_lines
+    code = card.code_example or ""
+
+    # Cut at the newline ending the last shown line
+    end = -1
+    for _ in range(max_lines):
+        end = code.find("\n", end + 1)
+    truncated_code = code[:end]
+    remaining_lines = line_count - max_lines
 
     # Add truncation indicator
     truncated_code += (
         f"\n\n# ... {remaining_lines} more lines - press 'e' to expand"
     )
 
-    syntax = Syntax(
-        truncated_code,
-        "python",
-        theme="catppuccin-mocha",
-        line_numbers=True,
-        background_color="#1e1e2e",
-    )
-    code_panel = Panel(
-        syntax,
-        title="💻 Code Example (Truncated)",
-        border_style="cyan",
-        padding=(1, 2),
-        width=80,
+    code_panel = _create_code_panel(
+        truncated_code, "💻 Code Example (Truncated)"
     )
     console.print(code_panel)
 
@@ -172,7 +233,8 @@ def _show_truncated_code(
     console.print(
         "[dim]Press 'e' to expand full code, or any other key to continue[/dim]"
     )
-    key = _get_arrow_key_input()
+    with _key_input_mode():
+        key = _get_arrow_key_input()
 
     if key.lower() == "e":
         _show_full_code(console, card)
@@ -182,26 +244,16 @@ def _show_full_code(console: Console, card: FlashCard) -> None:
     """Show full code with collapse option."""
     console.clear()
 
-    syntax = Syntax(
-        card.code_example or "",
-        "python",
-        theme="catppuccin-mocha",
-        line_numbers=True,
-        background_color="#1e1e2e",
-    )
-    code_panel = Panel(
-        syntax,
-        title="💻 Code Example (Full)",
-        border_style="cyan",
-        padding=(1, 2),
-        width=80,
+    code_panel = _create_code_panel(
+        card.code_example or "", "💻 Code Example (Full)"
     )
     console.print(code_panel)
 
     console.print(
         "[dim]Press 'c' to collapse, or any other key to continue[/dim]"
     )
-    key = _get_arrow_key_input()
+    with _key_input_mode():
+        key = _get_arrow_key_input()
 
     if key.lower() == "c":
         # Redraw the original flashcard screen with collapsed code
@@ -212,13 +264,14 @@ def _redraw_flashcard_with_collapsed_code(
     console: Console, card: FlashCard
 ) -> None:
     """Redraw the flashcard screen with question, answer, and collapsed code."""
-    console.clear()
+    with console:
+        console.clear()
 
-    # Redraw question
-    display_question(console, card)
+        # Redraw question
+        display_question(console, card)
 
-    # Redraw answer
-    display_answer(console, card)
+        # Redraw answer
+        display_answer(console, card)
 
     # Redraw code example in collapsed form
     if card.code_example:
@@ -226,10 +279,14 @@ def _redraw_flashcard_with_collapsed_code(
         _display_code_with_expansion(console, card)
 
 
+@lru_cache(maxsize=128)
 def _create_menu_display(
-    title: str, options: list[tuple[str, str]], selected_index: int
+    title: str, options: tuple[tuple[str, str], ...], selected_index: int
 ) -> Text:
-    """Create a generic menu display with highlighted selection."""
+    """Create a generic menu display with highlighted selection.
+
+    Cached, so moving the selection back and forth reuses each frame.
+    """
     menu_text = Text()
     menu_text.append(f"{title}\n\n", style="yellow bold")
 
@@ -247,9 +304,10 @@ def _create_menu_display(
     return menu_text
 
 
+@lru_cache(maxsize=128)
 def _create_scrollable_menu_display(
     title: str,
-    visible_options: list[tuple[str, str]],
+    visible_options: tuple[tuple[str, str], ...],
     selected_index: int,
     scroll_offset: int,
     total_items: int,
@@ -257,7 +315,11 @@ def _create_scrollable_menu_display(
     search_query: str = "",
     search_mode: bool = False,
 ) -> Text:
-    """Create menu display with scroll indicators for long lists."""
+    """Create menu display with scroll indicators for long lists.
+
+    Cached like _create_menu_display, so scrolling back and forth or
+    retyping a query reuses the frames already built.
+    """
     menu_text = Text()
     menu_text.append(f"{title}\n\n", style="yellow bold")
 
@@ -315,59 +377,174 @@ def _create_scrollable_menu_display(
     return menu_text
 
 
-def _get_arrow_key_input() -> str:
-    """Get keyboard input and return the key pressed."""
+_ARROW_KEYS = {"A": "up", "B": "down", "C": "right", "D": "left"}
+
+# Keys read from the terminal but not returned yet, e.g. when typing fast
+_pending_keys: deque[str] = deque()
+
+# Bytes per terminal read
+_READ_SIZE = 64
+
+# The start of a key that a full read cut off, completed by the next read
+_partial_key = bytearray()
+
+
+def _parse_keys(data: bytes) -> list[str]:
+    """Translate raw terminal input into key names, in order."""
+    text = data.decode("utf-8", errors="replace")
+    keys = []
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+        i += 1
+
+        # Handle escape sequences (arrow keys)
+        if ch == "\x1b":  # ESC
+            if text[i : i + 1] == "[" and i + 1 < len(text):
+                keys.append(_ARROW_KEYS.get(text[i + 1], ""))
+                i += 2
+            else:
+                # Single ESC key
+                keys.append("escape")
+        elif ch == "\r" or ch == "\n":  # Enter
+            keys.append("enter")
+        elif ch == "\x03":  # Ctrl+C
+            keys.append("quit")
+        elif ch == "\x7f":  # Backspace/Delete
+            keys.append("backspace")
+        elif ch == "/":
+            keys.append("search")
+        else:
+            keys.append(ch.lower())
+
+    return keys
+
+
+def _split_partial_key(data: bytes) -> tuple[bytes, bytes]:
+    """Split off a trailing escape sequence or UTF-8 character that the
+    read may have cut short.
+
+    Returns the complete keys and the cut-off start of the last one.
+    """
+    if data.endswith(b"\x1b"):
+        cut = len(data) - 1
+    elif data.endswith(b"\x1b["):
+        cut = len(data) - 2
+    else:
+        # Find where the last UTF-8 character starts
+        cut = len(data)
+        while cut > max(0, len(data) - 4) and data[cut - 1] & 0xC0 == 0x80:
+            cut -= 1
+        if cut == 0 or data[cut - 1] < 0xC0:
+            return data, b""
+        cut -= 1
+        lead = data[cut]
+        length = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+        if len(data) - cut >= length:
+            return data, b""
+
+    return data[:cut], data[cut:]
+
+
+# Whether _key_input_mode is active, so reads needn't switch modes
+_key_input_mode_active = False
+
+
+@contextmanager
+def _key_input_mode() -> Iterator[None]:
+    """Read single, unechoed key presses until the block exits.
+
+    Menus hold this for their whole loop, rather than switching terminal
+    modes for every key. Unlike tty.setraw, output processing stays on,
+    so the menu renders normally in between.
+
+    Keys read ahead are discarded when the block exits, so whatever
+    reads input next, e.g. a Prompt.ask or the next menu, doesn't
+    replay keys typed at this one. Nested blocks leave the mode and the
+    keys to the outermost one.
+    """
+    global _key_input_mode_active
+
+    if _key_input_mode_active:
+        yield
+        return
+
+    old_settings = None
     try:
         import termios
-        import tty
 
-        # Save current terminal settings
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
+    except ImportError:
+        pass  # Windows, etc.: keys are read with input()
+    except (OSError, termios.error):
+        pass  # Not a terminal
+
+    if old_settings is not None:
+        new_settings = termios.tcgetattr(fd)
+        # Ctrl+C arrives as a key, as in raw mode
+        new_settings[3] &= ~(
+            termios.ICANON | termios.ECHO | termios.ISIG | termios.IEXTEN
+        )
+        new_settings[6][termios.VMIN] = 1
+        new_settings[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, new_settings)
+        _key_input_mode_active = True
 
-        try:
-            # Set terminal to raw mode
-            tty.setraw(fd)
-
-            # Read first character
-            ch = sys.stdin.read(1)
-
-            # Handle escape sequences (arrow keys)
-            if ch == "\x1b":  # ESC
-                ch2 = sys.stdin.read(1)
-                if ch2 == "[":
-                    ch3 = sys.stdin.read(1)
-                    if ch3 == "A":
-                        return "up"
-                    elif ch3 == "B":
-                        return "down"
-                    elif ch3 == "C":
-                        return "right"
-                    elif ch3 == "D":
-                        return "left"
-                else:
-                    # Single ESC key
-                    return "escape"
-            elif ch == "\r" or ch == "\n":  # Enter
-                return "enter"
-            elif ch == "\x03":  # Ctrl+C
-                return "quit"
-            elif ch == "\x7f":  # Backspace/Delete
-                return "backspace"
-            elif ch == "/":
-                return "search"
-            else:
-                return ch.lower()
-
-        finally:
-            # Restore terminal settings
+    try:
+        yield
+    finally:
+        _pending_keys.clear()
+        _partial_key.clear()
+        if old_settings is not None:
+            _key_input_mode_active = False
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
+
+def _get_arrow_key_input() -> str:
+    """Get keyboard input and return the key pressed."""
+    if _pending_keys:
+        return _pending_keys.popleft()
+
+    try:
+        fd = sys.stdin.fileno()
+
+        # One read gets a whole escape sequence, plus any keys typed
+        # since the last call
+        if _key_input_mode_active:
+            data = os.read(fd, _READ_SIZE)
+        else:
+            import termios
+            import tty
+
+            # Save current terminal settings
+            old_settings = termios.tcgetattr(fd)
+
+            try:
+                # Set terminal to raw mode
+                tty.setraw(fd)
+                data = os.read(fd, _READ_SIZE)
+            finally:
+                # Restore terminal settings
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
     except (ImportError, OSError):
         # Fallback for systems without termios (Windows, etc.)
         return input().lower() or "enter"
 
-    return ""
+    # A full read may have stopped partway through a key, e.g. while an
+    # arrow key repeats; keep its start for the next read to complete.
+    # A shorter read took all there was, so a trailing ESC is the key
+    read_was_full = len(data) == _READ_SIZE
+    data = bytes(_partial_key) + data
+    _partial_key.clear()
+    if read_was_full:
+        data, partial = _split_partial_key(data)
+        _partial_key.extend(partial)
+
+    _pending_keys.extend(_parse_keys(data))
+    return _pending_keys.popleft() if _pending_keys else ""
 
 
 def display_flashcard_browser(
@@ -393,12 +570,15 @@ def display_flashcard_browser(
         question_preview = " ".join(question_preview.split())
         options.append((f"{i+1:2d}. {question_preview}", str(i)))
 
+    # Built once per visit, not each time the list reopens after a card
+    search_texts = _build_card_search_texts(flashcard_set.cards)
+
     while True:
         choice = _show_flashcard_searchable_menu(
             console,
             f"📖 Browse: {flashcard_set.title} ({len(flashcard_set.cards)} cards)",
             options,
-            flashcard_set.cards,
+            search_texts,
             default_index=0,
             allow_direct_keys=False,
         )
@@ -420,16 +600,17 @@ def _display_single_flashcard(
     console: Console, card: FlashCard, card_num: int, total: int
 ) -> None:
     """Display a single flashcard for browsing."""
-    console.clear()
+    with console:
+        console.clear()
 
-    # Show progress
-    display_progress(console, card_num, total)
+        # Show progress
+        display_progress(console, card_num, total)
 
-    # Show question
-    display_question(console, card)
+        # Show question
+        display_question(console, card)
 
-    # Show answer
-    display_answer(console, card)
+        # Show answer
+        display_answer(console, card)
 
     # Show code example if it exists
     if card.code_example:
@@ -441,7 +622,7 @@ def _display_single_flashcard(
 def _show_arrow_key_menu(
     console: Console,
     title: str,
-    options: list[tuple[str, str]],
+    options: Sequence[tuple[str, str]],
     default_index: int = 0,
     allow_direct_keys: bool = True,
     clear_screen: bool = True,
@@ -450,16 +631,25 @@ def _show_arrow_key_menu(
     if clear_screen:
         console.clear()
     selected_index = default_index
+    drawn_index: int | None = None
+    # Hashable, for the cached menu frames
+    options = tuple(options)
 
     try:
-        with Live(console=console, auto_refresh=False) as live:
+        with (
+            _key_input_mode(),
+            Live(console=console, auto_refresh=False) as live,
+        ):
             while True:
-                # Update display
-                menu_display = _create_menu_display(
-                    title, options, selected_index
-                )
-                live.update(menu_display)
-                live.refresh()
+                # Update display, unless the key didn't move the selection
+                # or more keys already read will move it again
+                if selected_index != drawn_index and not _pending_keys:
+                    menu_display = _create_menu_display(
+                        title, options, selected_index
+                    )
+                    live.update(menu_display)
+                    live.refresh()
+                    drawn_index = selected_index
 
                 # Get user input
                 key = _get_arrow_key_input()
@@ -508,17 +698,36 @@ def _filter_options(
     return filtered
 
 
+def _build_card_search_texts(flashcards: Sequence[FlashCard]) -> list[str]:
+    """Build each card's lowercased searchable text, indexed like the cards.
+
+    Built once per browser visit, so neither a search keystroke nor
+    returning to the list joins and lowercases every card again.
+    """
+    search_texts = []
+    for card in flashcards:
+        # Search in question, answer, and code example
+        searchable_text = f"{card.question} {card.answer}"
+        if card.code_example:
+            searchable_text += f" {card.code_example}"
+        search_texts.append(searchable_text.lower())
+    return search_texts
+
+
 def _filter_flashcard_options(
-    options: list[tuple[str, str]], flashcards: list[FlashCard], query: str
+    options: list[tuple[str, str]], search_texts: Sequence[str], query: str
 ) -> list[tuple[str, str]]:
-    """Filter flashcard options based on search query through full card content."""
+    """Filter flashcard options based on search query through full card content.
+
+    search_texts comes from _build_card_search_texts.
+    """
     if not query:
         return options
 
     query_lower = query.lower()
     filtered = []
 
-    for i, (label, value) in enumerate(options):
+    for label, value in options:
         # Skip the "Back to menu" option - always include it
         if value == "back":
             filtered.append((label, value))
@@ -527,16 +736,11 @@ def _filter_flashcard_options(
         # For flashcard options, search through the actual flashcard content
         if value.isdigit():
             card_index = int(value)
-            if 0 <= card_index < len(flashcards):
-                card = flashcards[card_index]
-
-                # Search in question, answer, and code example
-                searchable_text = f"{card.question} {card.answer}"
-                if card.code_example:
-                    searchable_text += f" {card.code_example}"
-
-                if query_lower in searchable_text.lower():
-                    filtered.append((label, value))
+            if (
+                0 <= card_index < len(search_texts)
+                and query_lower in search_texts[card_index]
+            ):
+                filtered.append((label, value))
         else:
             # Fallback to label search for non-flashcard options
             if query_lower in label.lower():
@@ -552,8 +756,15 @@ def _show_scrollable_arrow_key_menu(
     default_index: int = 0,
     allow_direct_keys: bool = True,
     clear_screen: bool = True,
+    filter_options: Callable[
+        [list[tuple[str, str]], str], list[tuple[str, str]]
+    ] = _filter_options,
 ) -> str:
-    """Enhanced arrow key menu with scrolling and search for long lists."""
+    """Enhanced arrow key menu with scrolling and search for long lists.
+
+    filter_options(options, query) narrows the options as the user types;
+    by default it matches the query against the labels.
+    """
     if clear_screen:
         console.clear()
 
@@ -561,7 +772,11 @@ def _show_scrollable_arrow_key_menu(
     scroll_offset = 0
     search_query = ""
     search_mode = False
-    filtered_options = options
+    # Filtered options for each prefix of the query: typing a character
+    # can only narrow the last result, and backspace returns to the one
+    # before, so neither rescans every option
+    filter_stack = [options]
+    drawn_frame: tuple[str, bool, int, int] | None = None
 
     # Calculate available height for menu items
     terminal_height = console.size.height
@@ -571,10 +786,12 @@ def _show_scrollable_arrow_key_menu(
     max_visible_items = max(5, terminal_height - reserved_lines)
 
     try:
-        with Live(console=console, auto_refresh=False) as live:
+        with (
+            _key_input_mode(),
+            Live(console=console, auto_refresh=False) as live,
+        ):
             while True:
-                # Apply search filter
-                filtered_options = _filter_options(options, search_query)
+                filtered_options = filter_stack[-1]
 
                 # Reset selection if out of bounds after filtering
                 if (
@@ -590,7 +807,7 @@ def _show_scrollable_arrow_key_menu(
                 # Calculate viewport window
                 if len(filtered_options) <= max_visible_items:
                     # All items fit, show everything
-                    visible_options = filtered_options
+                    visible_options = tuple(filtered_options)
                     visible_selected = (
                         selected_index if len(filtered_options) > 0 else 0
                     )
@@ -602,24 +819,39 @@ def _show_scrollable_arrow_key_menu(
                     elif selected_index >= scroll_offset + max_visible_items:
                         scroll_offset = selected_index - max_visible_items + 1
 
-                    visible_options = filtered_options[
-                        scroll_offset : scroll_offset + max_visible_items
-                    ]
+                    visible_options = tuple(
+                        filtered_options[
+                            scroll_offset : scroll_offset + max_visible_items
+                        ]
+                    )
                     visible_selected = selected_index - scroll_offset
 
-                # Create display with scroll indicators and search
-                menu_display = _create_scrollable_menu_display(
-                    title,
-                    visible_options,
-                    visible_selected,
-                    scroll_offset,
-                    len(filtered_options),
-                    max_visible_items,
+                # The query determines the filtered options, so this
+                # identifies the frame; keys that change none of it,
+                # e.g. unbound ones, don't redraw. Neither do keys with
+                # more already read behind them, so a burst of key
+                # repeats draws only the frame it ends on
+                frame = (
                     search_query,
                     search_mode,
+                    scroll_offset,
+                    visible_selected,
                 )
-                live.update(menu_display)
-                live.refresh()
+                if frame != drawn_frame and not _pending_keys:
+                    # Create display with scroll indicators and search
+                    menu_display = _create_scrollable_menu_display(
+                        title,
+                        visible_options,
+                        visible_selected,
+                        scroll_offset,
+                        len(filtered_options),
+                        max_visible_items,
+                        search_query,
+                        search_mode,
+                    )
+                    live.update(menu_display)
+                    live.refresh()
+                    drawn_frame = frame
 
                 # Handle input
                 key = _get_arrow_key_input()
@@ -629,14 +861,20 @@ def _show_scrollable_arrow_key_menu(
                     if key == "enter" or key == "escape":
                         search_mode = False
                     elif key == "backspace":
-                        search_query = search_query[:-1]
+                        if search_query:
+                            search_query = search_query[:-1]
+                            filter_stack.pop()
                     elif len(key) == 1 and key.isprintable() and key != "/":
                         search_query += key
+                        filter_stack.append(
+                            filter_options(filter_stack[-1], search_query)
+                        )
                 elif key == "search":  # "/" key
                     search_mode = True
                 elif key == "escape" and search_query:
                     # Clear search
                     search_query = ""
+                    filter_stack = [options]
                     search_mode = False
                     selected_index = 0
                     scroll_offset = 0
@@ -674,145 +912,36 @@ def _show_flashcard_searchable_menu(
     console: Console,
     title: str,
     options: list[tuple[str, str]],
-    flashcards: list[FlashCard],
+    search_texts: Sequence[str],
     default_index: int = 0,
     allow_direct_keys: bool = True,
     clear_screen: bool = True,
 ) -> str:
-    """Enhanced arrow key menu with scrolling and full-content search for flashcards."""
-    if clear_screen:
-        console.clear()
-
-    selected_index = default_index
-    scroll_offset = 0
-    search_query = ""
-    search_mode = False
-    filtered_options = options
+    """Enhanced arrow key menu with scrolling and full-content search for flashcards.
 
-    # Calculate available height for menu items
-    terminal_height = console.size.height
-    reserved_lines = (
-        10  # title, spacing, instructions, scroll indicators, search bar
+    search_texts comes from _build_card_search_texts.
+    """
+    return _show_scrollable_arrow_key_menu(
+        console,
+        title,
+        options,
+        default_index=default_index,
+        allow_direct_keys=allow_direct_keys,
+        clear_screen=clear_screen,
+        filter_options=lambda options, query: _filter_flashcard_options(
+            options, search_texts, query
+        ),
     )
-    max_visible_items = max(5, terminal_height - reserved_lines)
-
-    try:
-        with Live(console=console, auto_refresh=False) as live:
-            while True:
-                # Apply search filter using flashcard content
-                filtered_options = _filter_flashcard_options(
-                    options, flashcards, search_query
-                )
-
-                # Reset selection if out of bounds after filtering
-                if (
-                    selected_index >= len(filtered_options)
-                    and len(filtered_options) > 0
-                ):
-                    selected_index = 0
-                    scroll_offset = 0
-                elif len(filtered_options) == 0:
-                    selected_index = 0
-                    scroll_offset = 0
-
-                # Calculate viewport window
-                if len(filtered_options) <= max_visible_items:
-                    # All items fit, show everything
-                    visible_options = filtered_options
-                    visible_selected = (
-                        selected_index if len(filtered_options) > 0 else 0
-                    )
-                    scroll_offset = 0
-                else:
-                    # Need scrolling - adjust viewport
-                    if selected_index < scroll_offset:
-                        scroll_offset = selected_index
-                    elif selected_index >= scroll_offset + max_visible_items:
-                        scroll_offset = selected_index - max_visible_items + 1
-
-                    visible_options = filtered_options[
-                        scroll_offset : scroll_offset + max_visible_items
-                    ]
-                    visible_selected = selected_index - scroll_offset
-
-                # Create display with scroll indicators and search
-                menu_display = _create_scrollable_menu_display(
-                    title,
-                    visible_options,
-                    visible_selected,
-                    scroll_offset,
-                    len(filtered_options),
-                    max_visible_items,
-                    search_query,
-                    search_mode,
-                )
-                live.update(menu_display)
-                live.refresh()
-
-                # Handle input
-                key = _get_arrow_key_input()
-
-                if search_mode:
-                    # Handle search input
-                    if key == "enter" or key == "escape":
-                        search_mode = False
-                    elif key == "backspace":
-                        search_query = search_query[:-1]
-                    elif len(key) == 1 and key.isprintable() and key != "/":
-                        search_query += key
-                elif key == "search":  # "/" key
-                    search_mode = True
-                elif key == "escape" and search_query:
-                    # Clear search
-                    search_query = ""
-                    search_mode = False
-                    selected_index = 0
-                    scroll_offset = 0
-                elif key == "up" and len(filtered_options) > 0:
-                    selected_index = (selected_index - 1) % len(
-                        filtered_options
-                    )
-                elif key == "down" and len(filtered_options) > 0:
-                    selected_index = (selected_index + 1) % len(
-                        filtered_options
-                    )
-                elif key == "enter" and len(filtered_options) > 0:
-                    return filtered_options[selected_index][1]
-                elif allow_direct_keys and not search_mode:
-                    # Check if key matches any option value
-                    for _, value in filtered_options:
-                        if value == key:
-                            return value
-                elif key == "quit":
-                    # Return appropriate quit value based on options
-                    for _, value in options:
-                        if value in ["q", "quit"]:
-                            return value
-                    return "quit"
-
-    except KeyboardInterrupt:
-        # Return appropriate quit value
-        for _, value in options:
-            if value in ["q", "quit"]:
-                return value
-        return "quit"
 
 
 def get_user_response(console: Console) -> str:
     """Get user's response using arrow key menu."""
     console.print()  # Add spacing before menu
 
-    options = [
-        ("✅ Yes, I got it right", "y"),
-        ("❌ No, I got it wrong", "n"),
-        ("📊 Show session summary", "s"),
-        ("🚪 Quit to menu", "q"),
-    ]
-
     return _show_arrow_key_menu(
         console,
         "Did you get it right?",
-        options,
+        _RESPONSE_MENU_OPTIONS,
         default_index=0,
         clear_screen=False,
     )
@@ -821,9 +950,9 @@ def get_user_response(console: Console) -> str:
 def display_user_feedback(console: Console, response: str) -> None:
     """Display feedback based on user response."""
     if response == "y":
-        console.print("[green]Great job! 🎉[/green]")
+        console.print(_FEEDBACK_CORRECT)
     elif response == "n":
-        console.print("[yellow]Keep practicing! 💪[/yellow]")
+        console.print(_FEEDBACK_WRONG)
 
 
 def continue_to_next_card(
@@ -853,6 +982,8 @@ def display_statistics_table(
     console: Console, flashcard_set: FlashcardSet, set_stats: FlashcardSetStats
 ) -> None:
     """Display statistics table for current set."""
+    from rich.table import Table
+
     console.clear()
 
     table = Table(
@@ -893,6 +1024,8 @@ def display_global_statistics(
     console: Console, set_stats: dict[str, FlashcardSetStats]
 ) -> None:
     """Display statistics for all flashcard sets."""
+    from rich.table import Table
+
     console.clear()
 
     table = Table(
@@ -910,36 +1043,39 @@ def display_global_statistics(
     total_correct_all = 0
     sets_with_data = 0
 
-    for set_name_key, stats in set_stats.items():
-        if set_name_key != "legacy_data" and not set_name_key.startswith(
-            "tmp"
-        ):
+    # Look up display names and card counts once rather than per row
+    discovered_sets = {
+        os.path.splitext(os.path.basename(file_path))[0]: (
+            display_name,
+            card_count,
+        )
+        for display_name, file_path, card_count in discover_flashcard_sets()
+    }
+
+    for set_name_key, stats in get_valid_sets(set_stats):
+        display_name, card_count = discovered_sets.get(
+            set_name_key, (None, None)
+        )
+        if display_name is None:
             display_name = get_set_display_name(set_name_key)
-            set_attempts = stats.total_attempts
-            set_correct = stats.correct_answers
-            total_attempts_all += set_attempts
-            total_correct_all += set_correct
+        set_attempts = stats.total_attempts
+        set_correct = stats.correct_answers
+        total_attempts_all += set_attempts
+        total_correct_all += set_correct
 
-            # Try to get card count for this set
-            try:
-                card_count = get_set_card_count(set_name_key)
-                card_count_str = str(card_count) if card_count > 0 else "?"
-            except Exception:
-                card_count_str = "?"
-
-            if set_attempts > 0:
-                set_accuracy = stats.accuracy
-                table.add_row(
-                    display_name,
-                    card_count_str,
-                    str(set_attempts),
-                    f"{set_accuracy:.1f}%",
-                )
-                sets_with_data += 1
-            elif card_count_str != "?":
-                table.add_row(
-                    display_name, card_count_str, "0", "No attempts yet"
-                )
+        card_count_str = str(card_count) if card_count else "?"
+
+        if set_attempts > 0:
+            set_accuracy = stats.accuracy
+            table.add_row(
+                display_name,
+                card_count_str,
+                str(set_attempts),
+                f"{set_accuracy:.1f}%",
+            )
+            sets_with_data += 1
+        elif card_count_str != "?":
+            table.add_row(display_name, card_count_str, "0", "No attempts yet")
 
     # Add overall summary if we have data from multiple sets
     if sets_with_data > 1 and total_attempts_all > 0:
@@ -963,7 +1099,8 @@ def display_global_statistics(
 
 
 def display_flashcard_set_menu_with_stats(
-    console: Console, flashcard_sets: list[tuple[str, str]]
+    console: Console,
+    flashcard_sets: list[tuple[str, str, int | None]],
 ) -> str:
     """Display menu to select flashcard set with statistics option."""
     if not flashcard_sets:
@@ -980,20 +1117,10 @@ def display_flashcard_set_menu_with_stats(
     # Build options list with flashcard sets
     options = []
 
-    for display_name, file_path in flashcard_sets:
-        # Try to get card count
-        try:
-            # Extract just the filename without directory path
-            filename = os.path.basename(file_path)
-            set_name = (
-                filename.replace(".yaml", "")
-                .replace(".yml", "")
-                .replace(".json", "")
-            )
-            card_count = get_set_card_count(set_name)
-            card_display = f"({card_count} cards)"
-            option_label = f"📚 {display_name} {card_display}"
-        except Exception:
+    for display_name, file_path, card_count in flashcard_sets:
+        if card_count is not None:
+            option_label = f"📚 {display_name} ({card_count} cards)"
+        else:
             option_label = f"📚 {display_name} (? cards)"
 
         options.append((option_label, file_path))
@@ -1023,13 +1150,12 @@ def confirm_reset_stats(console: Console, set_title: str) -> bool:
     console.print("[dim]This action cannot be undone.[/dim]")
     console.print()
 
-    options = [
-        ("❌ No, keep my stats", "n"),
-        ("✅ Yes, reset stats", "y"),
-    ]
-
     choice = _show_arrow_key_menu(
-        console, "Confirm Reset", options, default_index=0, clear_screen=False
+        console,
+        "Confirm Reset",
+        _RESET_MENU_OPTIONS,
+        default_index=0,
+        clear_screen=False,
     )
 
     return choice == "y"
@@ -4,10 +4,12 @@ Unit tests for the functional flashcard application.
 """
 
 import pytest
+import io
 import json
 import yaml
 import tempfile
 import os
+from collections import deque
 from unittest.mock import patch
 
 from src.core.types import (
@@ -15,37 +17,65 @@ from src.core.types import (
     FlashcardSet,
     FlashcardSetStats,
     CardStats,
-    StudySession,
 )
 from src.io.operations import (
+    _YamlLoader,
     load_flashcard_file,
     load_statistics_file,
     save_statistics_file,
     discover_flashcard_sets,
+    get_flashcard_cache_path,
+    get_set_display_name,
 )
 from src.core.statistics import (
     update_card_stats,
     update_set_stats,
+    record_attempt,
     get_most_challenging_cards,
     calculate_overall_accuracy,
     calculate_session_summary,
+    get_valid_sets,
 )
 from src.core.session import (
     prepare_cards,
-    create_study_session,
-    advance_session,
+    run_study_session,
     handle_menu_choice,
 )
 from src.ui.interface import (
+    _build_card_search_texts,
+    _create_code_panel,
+    _create_menu_display,
     _create_scrollable_menu_display,
     _filter_options,
     _filter_flashcard_options,
+    _get_arrow_key_input,
+    _key_input_mode,
+    _parse_keys,
+    _show_arrow_key_menu,
+    _show_flashcard_searchable_menu,
+    _show_scrollable_arrow_key_menu,
+    _split_partial_key,
+    display_answer,
+    display_code_example,
+    display_flashcard_browser,
     display_menu,
+    display_progress,
+    display_question,
+    display_user_feedback,
+    get_user_response,
 )
 from rich.console import Console
 from rich.text import Text
 
 
+@pytest.fixture(autouse=True)
+def flashcard_cache_dir(tmp_path, monkeypatch):
+    """Keep parsed flashcard caches out of the user's cache directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "flashcards-tui"
+
+
 class TestFlashcardTypes:
     """Test the immutable data types."""
 
@@ -67,6 +97,11 @@ class TestFlashcardTypes:
             # AttributeError
             card.question = "Changed"  # type: ignore
 
+    def test_flashcard_key(self):
+        card = FlashCard(question="Q" * 60, answer="A")
+        assert card.key == "Q" * 50
+        assert card == FlashCard(question="Q" * 60, answer="A")
+
     def test_card_stats_accuracy(self):
         stats = CardStats(correct=8, total=10)
         assert stats.accuracy == 80.0
@@ -81,21 +116,14 @@ class TestFlashcardTypes:
         stats_zero = FlashcardSetStats(correct_answers=0, total_attempts=0)
         assert stats_zero.accuracy == 0.0
 
-    def test_study_session_properties(self):
-        cards = [
-            FlashCard(question="Q1", answer="A1"),
-            FlashCard(question="Q2", answer="A2"),
-        ]
-
-        session = StudySession(cards=cards, current_index=0)
-        assert not session.is_complete
-        assert session.current_card == cards[0]
-        assert session.progress == (1, 2)
-
-        session_complete = StudySession(cards=cards, current_index=2)
-        assert session_complete.is_complete
-        assert session_complete.current_card is None
-        assert session_complete.progress == (3, 2)
+    def test_per_card_types_use_slots(self):
+        # One instance per card, so no per-instance __dict__
+        for instance in (
+            FlashCard(question="Q", answer="A"),
+            CardStats(),
+            FlashcardSetStats(),
+        ):
+            assert not hasattr(instance, "__dict__")
 
 
 class TestIOOperations:
@@ -133,13 +161,101 @@ class TestIOOperations:
         flashcard_set = load_flashcard_file(temp_yaml_file)
 
         assert flashcard_set is not None
+        assert isinstance(flashcard_set.cards, tuple)
         assert len(flashcard_set.cards) == 2
         assert flashcard_set.title == "🧪 Test Flashcards"
         assert flashcard_set.cards[0].question == "What is a Python list?"
+        assert flashcard_set.cards[0].key == "What is a Python list?"
         assert (
             flashcard_set.cards[1].question == "What is a Python dictionary?"
         )
 
+    def test_load_flashcard_file_uses_json_cache(
+        self, temp_yaml_file, flashcard_cache_dir
+    ):
+        first = load_flashcard_file(temp_yaml_file)
+        # The cache goes in the cache directory, not next to the file
+        cache_path = get_flashcard_cache_path(temp_yaml_file)
+        assert os.path.dirname(cache_path) == str(flashcard_cache_dir)
+        assert os.path.exists(cache_path)
+        yaml_directory, yaml_name = os.path.split(temp_yaml_file)
+        assert not any(
+            name.startswith(f".{yaml_name}")
+            for name in os.listdir(yaml_directory)
+        )
+
+        # A later run reads the JSON cache instead of the YAML
+        with (
+            patch.dict("src.io.operations._flashcard_file_cache", clear=True),
+            patch("yaml.load") as mock_load,
+        ):
+            assert load_flashcard_file(temp_yaml_file) == first
+            mock_load.assert_not_called()
+
+        # Editing the YAML file invalidates the cache
+        stat = os.stat(temp_yaml_file)
+        os.utime(temp_yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        with (
+            patch.dict("src.io.operations._flashcard_file_cache", clear=True),
+            patch("yaml.load", wraps=yaml.load) as mock_load,
+        ):
+            assert load_flashcard_file(temp_yaml_file) == first
+            mock_load.assert_called_once()
+
+        # So does an edit that keeps the mtime but changes the size
+        stat = os.stat(temp_yaml_file)
+        with open(temp_yaml_file, "a") as f:
+            f.write("icon: 🐍\n")
+        os.utime(temp_yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        with patch.dict("src.io.operations._flashcard_file_cache", clear=True):
+            flashcard_set = load_flashcard_file(temp_yaml_file)
+        assert flashcard_set is not None
+        assert flashcard_set.cards == first.cards
+        with open(get_flashcard_cache_path(temp_yaml_file), "rb") as f:
+            assert json.load(f)["data"]["icon"] == "🐍"
+
+    def test_empty_flashcard_file_parse_is_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            open(os.path.join(temp_dir, "empty.yaml"), "w").close()
+            result = discover_flashcard_sets(temp_dir)
+
+            # The empty file's parse, None, is a cache hit too
+            with (
+                patch.dict(
+                    "src.io.operations._flashcard_file_cache", clear=True
+                ),
+                patch("yaml.load") as mock_load,
+            ):
+                assert discover_flashcard_sets(temp_dir) == result
+                mock_load.assert_not_called()
+
+    def test_yaml_loader_uses_libyaml_when_available(self):
+        if yaml.__with_libyaml__:
+            assert _YamlLoader is yaml.CSafeLoader
+        else:
+            assert _YamlLoader is yaml.SafeLoader
+
+    def test_load_flashcard_file_without_msgspec(self, temp_yaml_file):
+        with patch("src.io.operations.msgspec", None):
+            fallback_set = load_flashcard_file(temp_yaml_file)
+
+        assert fallback_set is not None
+        assert isinstance(fallback_set.cards, tuple)
+        assert fallback_set == load_flashcard_file(temp_yaml_file)
+
+    def test_load_flashcard_file_non_string_answer(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file = os.path.join(temp_dir, "numbers.yaml")
+            with open(yaml_file, "w") as f:
+                yaml.dump(
+                    {"flashcards": [{"question": "6*7", "answer": 42}]}, f
+                )
+
+            flashcard_set = load_flashcard_file(yaml_file)
+
+        assert flashcard_set is not None
+        assert flashcard_set.cards[0].answer == 42
+
     def test_load_flashcard_file_not_found(self):
         with patch("rich.console.Console.print") as mock_print:
             result = load_flashcard_file("nonexistent.yaml")
@@ -171,6 +287,10 @@ class TestIOOperations:
             assert result["test_set"].correct_answers == 5
             assert result["test_set"].total_attempts == 10
             assert len(result["test_set"].card_stats) == 1
+
+            # The generic loader used without msgspec agrees
+            with patch("src.io.operations.msgspec", None):
+                assert load_statistics_file(temp_file) == result
         finally:
             os.unlink(temp_file)
 
@@ -226,12 +346,132 @@ class TestIOOperations:
         finally:
             os.unlink(temp_file)
 
+    def test_save_statistics_file_keeps_old_file_on_failure(self):
+        stats = {"test_set": FlashcardSetStats(correct_answers=1)}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "stats.json")
+            save_statistics_file(temp_file, stats)
+
+            with (
+                patch("os.replace", side_effect=OSError("disk full")),
+                patch("rich.console.Console.print"),
+            ):
+                assert save_statistics_file(temp_file, {}) is False
+
+            assert load_statistics_file(temp_file) == stats
+            assert os.listdir(temp_dir) == ["stats.json"]
+
+    def test_save_statistics_file_syncs_before_replace(self):
+        calls = []
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "stats.json")
+            with (
+                patch(
+                    "os.fsync", side_effect=lambda fd: calls.append("fsync")
+                ),
+                patch(
+                    "os.replace",
+                    side_effect=lambda *args: calls.append("replace"),
+                ),
+            ):
+                assert save_statistics_file(temp_file, {}) is True
+
+        assert calls == ["fsync", "replace"]
+
+    def test_save_statistics_file_keeps_file_mode(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # A new file gets the same mode as one created with open()
+            opened_file = os.path.join(temp_dir, "opened.json")
+            open(opened_file, "w").close()
+            new_file = os.path.join(temp_dir, "new.json")
+            assert save_statistics_file(new_file, {}) is True
+            assert os.stat(new_file).st_mode == os.stat(opened_file).st_mode
+
+            # An existing file keeps its own mode
+            temp_file = os.path.join(temp_dir, "stats.json")
+            with open(temp_file, "w") as f:
+                f.write("{}")
+            os.chmod(temp_file, 0o640)
+            assert save_statistics_file(temp_file, {}) is True
+            assert os.stat(temp_file).st_mode & 0o777 == 0o640
+
+    def test_statistics_round_trip_without_orjson(self):
+        stats = {
+            "test_set": FlashcardSetStats(
+                correct_answers=2,
+                total_attempts=3,
+                card_stats={"Q1": CardStats(correct=2, total=3)},
+            )
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "stats.json")
+            with patch("src.io.operations.orjson", None):
+                assert save_statistics_file(temp_file, stats) is True
+                result = load_statistics_file(temp_file)
+
+        assert result == stats
+
+    def test_statistics_round_trip_msgpack(self):
+        pytest.importorskip("msgspec")
+        stats = {
+            "test_set": FlashcardSetStats(
+                correct_answers=2,
+                total_attempts=3,
+                card_stats={"Q1": CardStats(correct=2, total=3)},
+            )
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "stats.msgpack")
+            assert save_statistics_file(temp_file, stats) is True
+            assert load_statistics_file(temp_file) == stats
+
+    def test_load_statistics_msgpack_migrates_json(self):
+        stats = {"test_set": FlashcardSetStats(correct_answers=1)}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_statistics_file(os.path.join(temp_dir, "stats.json"), stats)
+            result = load_statistics_file(
+                os.path.join(temp_dir, "stats.msgpack")
+            )
+
+        assert result == stats
+
+    def test_load_statistics_file_missing(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "stats.json")
+            with patch("builtins.open") as mock_open:
+                assert load_statistics_file(temp_file) == {}
+            mock_open.assert_not_called()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_load_statistics_file_corrupted(self, use_orjson):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "stats.json")
+            with open(temp_file, "wb") as f:
+                f.write(b'{"flashcard_sets": \xff\xfe')
+
+            if use_orjson:
+                assert load_statistics_file(temp_file) == {}
+            else:
+                with patch("src.io.operations.orjson", None):
+                    assert load_statistics_file(temp_file) == {}
+
     def test_discover_flashcard_sets(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create test files
             yaml_file = os.path.join(temp_dir, "test.yaml")
             with open(yaml_file, "w") as f:
-                yaml.dump({"title": "Test YAML", "flashcards": []}, f)
+                yaml.dump(
+                    {
+                        "title": "Test YAML",
+                        "flashcards": [{"question": "Q", "answer": "A"}],
+                    },
+                    f,
+                )
 
             yml_file = os.path.join(temp_dir, "test2.yml")
             with open(yml_file, "w") as f:
@@ -240,14 +480,54 @@ class TestIOOperations:
             # Create a file to ignore
             with open(os.path.join(temp_dir, ".hidden.yaml"), "w") as f:
                 yaml.dump({"flashcards": []}, f)
+            os.mkdir(os.path.join(temp_dir, "not_a_set.yaml"))
 
             result = discover_flashcard_sets(temp_dir)
 
-            # Should find 2 files, sorted by name
-            assert len(result) == 2
-            display_names = [name for name, _ in result]
-            assert "Test YAML" in display_names
-            assert "Test YML" in display_names
+            # Should find 2 files, sorted by title, with their card counts
+            assert result == [
+                ("Test YAML", yaml_file, 1),
+                ("Test YML", yml_file, 0),
+            ]
+
+            # Unchanged files are served from the metadata cache
+            with patch("yaml.load") as mock_load:
+                assert discover_flashcard_sets(temp_dir) == result
+                mock_load.assert_not_called()
+
+    def test_get_set_display_name(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, "flashcard_sets"))
+            yml_file = os.path.join(temp_dir, "flashcard_sets", "my_set.yml")
+            with open(yml_file, "w") as f:
+                yaml.dump(
+                    {
+                        "title": "My Set",
+                        "icon": "🐍",
+                        "flashcards": [{"question": "Q", "answer": "A"}],
+                    },
+                    f,
+                )
+            monkeypatch.chdir(temp_dir)
+
+            assert get_set_display_name("my_set") == "🐍 My Set"
+            assert get_set_display_name("missing_set") == "Missing Set"
+
+    def test_load_flashcard_file_after_discovery(self, sample_flashcard_data):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file = os.path.join(temp_dir, "test.yaml")
+            with open(yaml_file, "w") as f:
+                yaml.dump(sample_flashcard_data, f)
+
+            discover_flashcard_sets(temp_dir)
+
+            # The set picked from the menu is not parsed a second time
+            with patch("yaml.load") as mock_load:
+                flashcard_set = load_flashcard_file(yaml_file)
+                mock_load.assert_not_called()
+
+            assert flashcard_set is not None
+            assert len(flashcard_set.cards) == 2
 
 
 class TestStatistics:
@@ -283,6 +563,28 @@ class TestStatistics:
         assert updated_correct.card_stats[card_key].correct == 1
         assert updated_correct.card_stats[card_key].total == 1
 
+    def test_update_set_stats_leaves_original_untouched(self):
+        card = FlashCard(question="Q1", answer="A1")
+        initial_stats = FlashcardSetStats(
+            card_stats={"Q1": CardStats(correct=1, total=1)}
+        )
+
+        updated = update_set_stats(initial_stats, card, False)
+
+        assert initial_stats.card_stats["Q1"] == CardStats(correct=1, total=1)
+        assert updated.card_stats["Q1"] == CardStats(correct=1, total=2)
+
+    def test_record_attempt_updates_card_stats_in_place(self):
+        card = FlashCard(question="Q1", answer="A1")
+        initial_stats = FlashcardSetStats()
+
+        updated = record_attempt(initial_stats, card, True)
+
+        assert updated.correct_answers == 1
+        assert updated.total_attempts == 1
+        assert updated.card_stats is initial_stats.card_stats
+        assert updated.card_stats["Q1"] == CardStats(correct=1, total=1)
+
     def test_get_most_challenging_cards(self):
         card_stats = {
             "Easy question": CardStats(correct=9, total=10),  # 90% accuracy
@@ -313,6 +615,15 @@ class TestStatistics:
         assert abs(accuracy - 76.67) < 0.01  # (8+15)/(10+20) * 100 = 76.67
         assert total == 30
 
+    def test_get_valid_sets(self):
+        set_stats = {
+            "set1": FlashcardSetStats(),
+            "legacy_data": FlashcardSetStats(),
+            "tmpabc123": FlashcardSetStats(),
+        }
+
+        assert [name for name, _ in get_valid_sets(set_stats)] == ["set1"]
+
     def test_calculate_session_summary(self):
         set_stats = FlashcardSetStats(correct_answers=7, total_attempts=10)
         summary = calculate_session_summary(5, set_stats)
@@ -337,49 +648,74 @@ class TestStudySession:
             cards=cards, name="test", title="Test Set", file_path="test.yaml"
         )
 
-        # Test without randomization
+        # Test without randomization: the set's list is reused, not copied
         result = prepare_cards(flashcard_set, randomize=False)
-        assert result == cards
+        assert result is cards
 
         # Test with randomization
-        with patch("random.shuffle") as mock_shuffle:
+        with patch("random.sample") as mock_sample:
             prepare_cards(flashcard_set, randomize=True)
-            mock_shuffle.assert_called_once()
+            mock_sample.assert_called_once_with(cards, 3)
+
+        shuffled = prepare_cards(flashcard_set, randomize=True)
+        assert sorted(c.question for c in shuffled) == ["Q1", "Q2", "Q3"]
+        assert flashcard_set.cards == cards
 
-    def test_create_study_session(self):
+    def test_run_study_session_keeps_stats_on_interrupt(self):
         cards = [
             FlashCard(question="Q1", answer="A1"),
             FlashCard(question="Q2", answer="A2"),
         ]
-
         flashcard_set = FlashcardSet(
             cards=cards, name="test", title="Test Set", file_path="test.yaml"
         )
+        console = Console()
 
-        session = create_study_session(flashcard_set, randomize=False)
+        with (
+            patch("src.core.session.wait_for_user_thinking"),
+            patch("src.core.session.get_user_response", return_value="y"),
+            patch(
+                "src.core.session.continue_to_next_card",
+                side_effect=KeyboardInterrupt,
+            ),
+            patch("src.core.session.show_session_summary"),
+        ):
+            new_stats, cards_studied = run_study_session(
+                console, flashcard_set, FlashcardSetStats()
+            )
 
-        assert len(session.cards) == 2
-        assert session.current_index == 0
-        assert session.correct_count == 0
-        assert session.randomized is False
+        assert cards_studied == 1
+        assert new_stats.correct_answers == 1
+        assert new_stats.card_stats["Q1"] == CardStats(correct=1, total=1)
 
-    def test_advance_session(self):
+    def test_run_study_session_saves_progress_periodically(self):
         cards = [
-            FlashCard(question="Q1", answer="A1"),
-            FlashCard(question="Q2", answer="A2"),
+            FlashCard(question=f"Q{i}", answer=f"A{i}") for i in range(12)
         ]
+        flashcard_set = FlashcardSet(
+            cards=cards, name="test", title="Test Set", file_path="test.yaml"
+        )
+        saved_attempts = []
+
+        with (
+            patch("src.core.session.wait_for_user_thinking"),
+            patch("src.core.session.get_user_response", return_value="y"),
+            patch("src.core.session.continue_to_next_card"),
+            patch("src.core.session.show_session_summary"),
+        ):
+            new_stats, cards_studied = run_study_session(
+                Console(),
+                flashcard_set,
+                FlashcardSetStats(),
+                save_progress=lambda stats: saved_attempts.append(
+                    stats.total_attempts
+                ),
+            )
 
-        session = StudySession(cards=cards, current_index=0, correct_count=0)
-
-        # Advance with correct answer
-        advanced_correct = advance_session(session, True)
-        assert advanced_correct.current_index == 1
-        assert advanced_correct.correct_count == 1
-
-        # Advance with incorrect answer
-        advanced_incorrect = advance_session(session, False)
-        assert advanced_incorrect.current_index == 1
-        assert advanced_incorrect.correct_count == 0
+        # One checkpoint after 10 answers; the caller saves the rest
+        assert saved_attempts == [10]
+        assert cards_studied == 12
+        assert new_stats.total_attempts == 12
 
     def test_handle_menu_choice_browse(self):
         """Test handle_menu_choice with browse option."""
@@ -480,7 +816,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu",
-            visible_options=options,
+            visible_options=tuple(options),
             selected_index=1,
             scroll_offset=0,
             total_items=3,
@@ -513,7 +849,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu",
-            visible_options=visible_options,
+            visible_options=tuple(visible_options),
             selected_index=0,
             scroll_offset=0,
             total_items=10,
@@ -539,7 +875,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu",
-            visible_options=visible_options,
+            visible_options=tuple(visible_options),
             selected_index=1,
             scroll_offset=3,
             total_items=10,
@@ -566,7 +902,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu",
-            visible_options=visible_options,
+            visible_options=tuple(visible_options),
             selected_index=2,
             scroll_offset=7,
             total_items=10,
@@ -607,13 +943,88 @@ class TestUIInterface:
             assert "b" in option_values
             assert result == "b"
 
+    def test_menu_display_frames_are_reused(self):
+        options = (("First", "1"), ("Second", "2"))
+
+        first = _create_menu_display("Menu", options, 0)
+        assert "❯ First" in first.plain
+        assert "  Second" in first.plain
+        assert _create_menu_display("Menu", options, 0) is first
+        assert "❯ Second" in _create_menu_display("Menu", options, 1).plain
+
+        scrolled = _create_scrollable_menu_display("Menu", options, 1, 0, 9, 2)
+        assert "❯ Second" in scrolled.plain
+        assert (
+            _create_scrollable_menu_display("Menu", options, 1, 0, 9, 2)
+            is scrolled
+        )
+
+    def test_long_code_example_is_truncated(self):
+        # A 20-line terminal leaves room for the minimum of 6 code lines
+        console = Console(file=io.StringIO(), height=20)
+        card = FlashCard(
+            question="Q",
+            answer="A",
+            code_example="\n".join(map(str, range(10))),
+        )
+
+        with (
+            patch("src.ui.interface._get_arrow_key_input", return_value="x"),
+            patch(
+                "src.ui.interface._create_code_panel",
+                wraps=_create_code_panel,
+            ) as mock_panel,
+        ):
+            display_code_example(console, card)
+
+        mock_panel.assert_called_once_with(
+            "0\n1\n2\n3\n4\n5\n\n# ... 4 more lines - press 'e' to expand",
+            "💻 Code Example (Truncated)",
+        )
+
+    def test_card_panels_are_reused(self):
+        """Test that redrawing a card reuses its question/answer panels."""
+        console = Console()
+        card = FlashCard(question="Reused Q", answer="Reused A")
+
+        with patch.object(console, "print") as mock_print:
+            display_question(console, card)
+            display_answer(console, card)
+            display_question(console, card)
+            display_answer(console, card)
+
+        panels = [call.args[0] for call in mock_print.call_args_list]
+        assert panels[0] is panels[2]
+        assert panels[1] is panels[3]
+        assert panels[0].title == "❓ Question"
+
+    def test_display_progress(self):
+        console = Console(record=True, width=40)
+
+        with patch.object(console, "print", wraps=console.print) as spy:
+            display_progress(console, 3, 12)
+
+        spy.assert_called_once()
+        assert console.export_text() == "Card 3/12\n\n"
+
+    def test_user_feedback_messages(self):
+        console = Console(record=True, width=40)
+
+        display_user_feedback(console, "y")
+        display_user_feedback(console, "n")
+        display_user_feedback(console, "s")
+
+        assert console.export_text() == (
+            "Great job! 🎉\nKeep practicing! 💪\n"
+        )
+
     def test_scrollable_menu_display_text_object(self):
         """Test that scrollable menu display returns a Rich Text object."""
         options = [("Test Option", "test")]
 
         display = _create_scrollable_menu_display(
             title="Test",
-            visible_options=options,
+            visible_options=tuple(options),
             selected_index=0,
             scroll_offset=0,
             total_items=1,
@@ -632,7 +1043,7 @@ class TestUIInterface:
         """Test scrollable menu display with empty options list."""
         display = _create_scrollable_menu_display(
             title="Empty Menu",
-            visible_options=[],
+            visible_options=(),
             selected_index=0,
             scroll_offset=0,
             total_items=0,
@@ -657,7 +1068,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu with Emojis 🎓",
-            visible_options=options,
+            visible_options=tuple(options),
             selected_index=0,
             scroll_offset=0,
             total_items=3,
@@ -679,7 +1090,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu",
-            visible_options=options,
+            visible_options=tuple(options),
             selected_index=0,
             scroll_offset=0,
             total_items=1,
@@ -700,7 +1111,7 @@ class TestUIInterface:
 
         display = _create_scrollable_menu_display(
             title="Test Menu",
-            visible_options=options,
+            visible_options=tuple(options),
             selected_index=0,
             scroll_offset=0,
             total_items=1,
@@ -830,7 +1241,9 @@ class TestUIInterface:
             ),
         ]
 
-        result = _filter_flashcard_options(options, flashcards, "")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), ""
+        )
         assert result == options
 
     def test_filter_flashcard_options_by_question(self):
@@ -855,7 +1268,9 @@ class TestUIInterface:
         ]
 
         # Search by question content
-        result = _filter_flashcard_options(options, flashcards, "python")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "python"
+        )
         assert len(result) == 2  # Back button + matching card
         assert ("🔙 Back to menu", "back") in result
         assert ("1. What is Python?", "0") in result
@@ -878,7 +1293,9 @@ class TestUIInterface:
         ]
 
         # Search by answer content
-        result = _filter_flashcard_options(options, flashcards, "programming")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "programming"
+        )
         assert len(result) == 2  # Back button + matching card
         assert ("🔙 Back to menu", "back") in result
         assert ("1. What is Python?", "0") in result
@@ -904,13 +1321,17 @@ class TestUIInterface:
         ]
 
         # Search by code content
-        result = _filter_flashcard_options(options, flashcards, "alice")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "alice"
+        )
         assert len(result) == 2  # Back button + matching card
         assert ("🔙 Back to menu", "back") in result
         assert ("1. Variables", "0") in result
 
         # Search by function keyword
-        result = _filter_flashcard_options(options, flashcards, "def")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "def"
+        )
         assert len(result) == 2  # Back button + matching card
         assert ("🔙 Back to menu", "back") in result
         assert ("2. Functions", "1") in result
@@ -929,7 +1350,9 @@ class TestUIInterface:
 
         # Test various cases
         for query in ["python", "PYTHON", "Python", "PyThOn"]:
-            result = _filter_flashcard_options(options, flashcards, query)
+            result = _filter_flashcard_options(
+                options, _build_card_search_texts(flashcards), query
+            )
             assert len(result) == 2  # Back button + matching card
             assert ("1. Python Basics", "0") in result
 
@@ -955,7 +1378,9 @@ class TestUIInterface:
         ]
 
         # Should match both Python cards
-        result = _filter_flashcard_options(options, flashcards, "python")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "python"
+        )
         assert len(result) == 3  # Back button + 2 matching cards
         assert ("🔙 Back to menu", "back") in result
         assert ("1. Python Variables", "0") in result
@@ -977,7 +1402,9 @@ class TestUIInterface:
         ]
 
         # Search for something that doesn't exist
-        result = _filter_flashcard_options(options, flashcards, "nonexistent")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "nonexistent"
+        )
         assert len(result) == 1  # Only back button
         assert result[0] == ("🔙 Back to menu", "back")
 
@@ -992,10 +1419,294 @@ class TestUIInterface:
         ]
 
         # Even with no matches, back button should be included
-        result = _filter_flashcard_options(options, flashcards, "nomatch")
+        result = _filter_flashcard_options(
+            options, _build_card_search_texts(flashcards), "nomatch"
+        )
         assert len(result) == 1
         assert result[0] == ("🔙 Back to menu", "back")
 
+    def test_parse_keys(self):
+        assert _parse_keys(b"\x1b[A") == ["up"]
+        assert _parse_keys(b"\x1b") == ["escape"]
+        # Several keys from one read are kept in order
+        assert _parse_keys(b"\x1b[B\x1b[Dq/\x7f\r\x03") == [
+            "down",
+            "left",
+            "q",
+            "search",
+            "backspace",
+            "enter",
+            "quit",
+        ]
+        assert _parse_keys("Ü".encode()) == ["ü"]
+
+    def test_split_partial_key(self):
+        assert _split_partial_key(b"q\x1b[B") == (b"q\x1b[B", b"")
+        assert _split_partial_key(b"q\x1b") == (b"q", b"\x1b")
+        assert _split_partial_key(b"q\x1b[") == (b"q", b"\x1b[")
+        assert _split_partial_key("qÜ".encode()) == ("qÜ".encode(), b"")
+        assert _split_partial_key("q€".encode()[:-1]) == (
+            b"q",
+            "€".encode()[:-1],
+        )
+
+    def test_key_input_mode_spans_reads(self):
+        termios = pytest.importorskip("termios")
+        pty = pytest.importorskip("pty")
+        master, slave = pty.openpty()
+
+        with (
+            os.fdopen(slave, "rb", buffering=0) as terminal,
+            patch("sys.stdin", terminal),
+        ):
+            with _key_input_mode():
+                assert not termios.tcgetattr(slave)[3] & termios.ICANON
+                os.write(master, b"\x1b[Bq")
+
+                # Keys are read without switching terminal modes per key
+                with patch("termios.tcsetattr") as mock_setattr:
+                    assert _get_arrow_key_input() == "down"
+                    assert _get_arrow_key_input() == "q"
+                mock_setattr.assert_not_called()
+
+            assert termios.tcgetattr(slave)[3] & termios.ICANON
+        os.close(master)
+
+    def test_nested_key_input_mode_is_a_no_op(self):
+        termios = pytest.importorskip("termios")
+        pty = pytest.importorskip("pty")
+        master, slave = pty.openpty()
+
+        with (
+            os.fdopen(slave, "rb", buffering=0) as terminal,
+            patch("sys.stdin", terminal),
+        ):
+            with _key_input_mode():
+                os.write(master, b"a")
+                with _key_input_mode():
+                    assert _get_arrow_key_input() == "a"
+
+                # The outer block still holds the terminal in its mode
+                assert not termios.tcgetattr(slave)[3] & termios.ICANON
+                with (
+                    patch("os.read", return_value=b"b"),
+                    patch("termios.tcsetattr") as mock_setattr,
+                ):
+                    assert _get_arrow_key_input() == "b"
+                mock_setattr.assert_not_called()
+
+            assert termios.tcgetattr(slave)[3] & termios.ICANON
+        os.close(master)
+
+    def test_keys_typed_ahead_at_a_menu_are_not_replayed(self):
+        pytest.importorskip("termios")
+        pty = pytest.importorskip("pty")
+        master, slave = pty.openpty()
+        console = Console(file=io.StringIO())
+
+        with (
+            os.fdopen(slave, "rb", buffering=0) as terminal,
+            patch("sys.stdin", terminal),
+        ):
+            # "y" answers the menu; the Enter after it mustn't answer
+            # the next card's menu
+            os.write(master, b"y\r")
+            assert get_user_response(console) == "y"
+            os.write(master, b"n")
+            assert get_user_response(console) == "n"
+        os.close(master)
+
+    def test_held_arrow_key_split_across_reads(self):
+        pytest.importorskip("termios")
+        pty = pytest.importorskip("pty")
+        master, slave = pty.openpty()
+        options = [("A", "a"), ("B", "b"), ("C", "c"), ("D", "d")]
+
+        with (
+            os.fdopen(slave, "rb", buffering=0) as terminal,
+            patch("sys.stdin", terminal),
+        ):
+            # 22 repeats don't fit one read; the 22nd is cut after ESC,
+            # which mustn't become Escape, "[" and the "b" option
+            os.write(master, b"\x1b[B" * 22 + b"\r")
+            choice = _show_arrow_key_menu(
+                Console(file=io.StringIO()), "Menu", options
+            )
+        os.close(master)
+
+        assert choice == "c"
+
+    def test_held_arrow_key_draws_once_per_read(self):
+        pytest.importorskip("termios")
+        pty = pytest.importorskip("pty")
+        options = [("A", "a"), ("B", "b"), ("C", "c"), ("D", "d")]
+
+        for menu, display in (
+            (_show_arrow_key_menu, _create_menu_display),
+            (_show_scrollable_arrow_key_menu, _create_scrollable_menu_display),
+        ):
+            master, slave = pty.openpty()
+            with (
+                os.fdopen(slave, "rb", buffering=0) as terminal,
+                patch("sys.stdin", terminal),
+                patch(
+                    f"src.ui.interface.{display.__name__}", wraps=display
+                ) as mock_display,
+            ):
+                # The repeats take two reads
+                os.write(master, b"\x1b[B" * 22 + b"\r")
+                choice = menu(Console(file=io.StringIO()), "Menu", options)
+            os.close(master)
+
+            assert choice == "c"
+            # The first frame, then one after each read rather than one
+            # per key; the last read ends with Enter, so isn't drawn
+            assert mock_display.call_count == 2
+
+    def test_browser_builds_search_texts_once_per_visit(self):
+        flashcard_set = FlashcardSet(
+            cards=(
+                FlashCard(question="Q1", answer="A1"),
+                FlashCard(question="Q2", answer="A2"),
+            ),
+            name="test",
+            title="Test",
+            file_path="test.yaml",
+        )
+
+        with (
+            patch(
+                "src.ui.interface._show_flashcard_searchable_menu",
+                side_effect=["0", "1", "back"],
+            ) as mock_menu,
+            patch("src.ui.interface._display_single_flashcard") as mock_show,
+            patch(
+                "src.ui.interface._build_card_search_texts",
+                wraps=_build_card_search_texts,
+            ) as mock_build,
+        ):
+            display_flashcard_browser(Console(), flashcard_set)
+
+        mock_build.assert_called_once()
+        assert mock_menu.call_count == 3
+        assert mock_show.call_count == 2
+
+    def test_scrollable_menu_searches_labels_by_default(self):
+        options = [("Python", "py"), ("JavaScript", "js"), ("Rust", "rs")]
+        keys = ["search", "s", "enter", "down", "enter"]
+
+        with patch("src.ui.interface._get_arrow_key_input", side_effect=keys):
+            choice = _show_scrollable_arrow_key_menu(
+                Console(file=io.StringIO()), "Languages", options
+            )
+
+        # "s" leaves JavaScript and Rust
+        assert choice == "rs"
+
+    def test_searchable_menu_skips_redraw_for_unbound_keys(self):
+        options = [("🔙 Back to menu", "back"), ("1. Python", "0")]
+        flashcards = [FlashCard(question="What is Python?", answer="A")]
+        keys = ["left", "right", "x", "down", "left", "enter"]
+
+        with (
+            patch("src.ui.interface._get_arrow_key_input", side_effect=keys),
+            patch(
+                "src.ui.interface._create_scrollable_menu_display",
+                wraps=_create_scrollable_menu_display,
+            ) as mock_display,
+        ):
+            choice = _show_flashcard_searchable_menu(
+                Console(file=io.StringIO()),
+                "Browse",
+                options,
+                _build_card_search_texts(flashcards),
+            )
+
+        assert choice == "0"
+        # Only the first frame and the one after "down" are drawn
+        assert mock_display.call_count == 2
+
+    def test_menus_draw_once_per_burst_of_keys(self):
+        options = [("First", "1"), ("Second", "2"), ("Third", "3")]
+
+        # Keys already read are applied before drawing; the read after
+        # them falls back to input(), where Enter picks the selection
+        with (
+            patch("src.ui.interface._pending_keys", deque(["down", "down"])),
+            patch("builtins.input", return_value=""),
+            patch(
+                "src.ui.interface._create_menu_display",
+                wraps=_create_menu_display,
+            ) as mock_display,
+        ):
+            choice = _show_arrow_key_menu(
+                Console(file=io.StringIO()), "Menu", options
+            )
+
+        assert choice == "3"
+        assert mock_display.call_count == 1
+
+        with (
+            patch(
+                "src.ui.interface._pending_keys",
+                deque(["down", "down", "up"]),
+            ),
+            patch("builtins.input", return_value=""),
+            patch(
+                "src.ui.interface._create_scrollable_menu_display",
+                wraps=_create_scrollable_menu_display,
+            ) as mock_display,
+        ):
+            choice = _show_scrollable_arrow_key_menu(
+                Console(file=io.StringIO()), "Menu", options
+            )
+
+        assert choice == "2"
+        assert mock_display.call_count == 1
+
+    def test_flashcard_search_narrows_incrementally(self):
+        options = [
+            ("🔙 Back to menu", "back"),
+            ("1. Python", "0"),
+            ("2. Pytest", "1"),
+            ("3. Rust", "2"),
+        ]
+        flashcards = [
+            FlashCard(question="What is Python?", answer="A language"),
+            FlashCard(question="What is pytest?", answer="A test runner"),
+            FlashCard(question="What is Rust?", answer="A language"),
+        ]
+        keys = ["search", "p", "y", "t", "h", "backspace", "e", "enter"]
+        keys += ["down", "enter"]
+
+        with (
+            patch("src.ui.interface._get_arrow_key_input", side_effect=keys),
+            patch(
+                "src.ui.interface._filter_flashcard_options",
+                wraps=_filter_flashcard_options,
+            ) as mock_filter,
+        ):
+            choice = _show_flashcard_searchable_menu(
+                Console(file=io.StringIO()),
+                "Browse",
+                options,
+                _build_card_search_texts(flashcards),
+            )
+
+        assert choice == "1"
+        # Each typed character filters the previous result; backspace and
+        # navigation don't filter at all
+        searched = [call.args[0] for call in mock_filter.call_args_list]
+        assert [call.args[2] for call in mock_filter.call_args_list] == [
+            "p",
+            "py",
+            "pyt",
+            "pyth",
+            "pyte",
+        ]
+        assert searched[1] == [options[0], options[1], options[2]]
+        assert searched[4] == searched[3]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])